@@ -80,7 +80,7 @@ class DashboardManager:
                 logger.warning(f"Updates file not found: {UPDATES_FILE}")
                 return
 
-            with open(UPDATES_FILE, 'r') as f:
+            with open(UPDATES_FILE, 'r', encoding='utf-8') as f:
                 raw_updates = json.load(f)
 
             self.updates = []
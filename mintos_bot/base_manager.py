@@ -5,6 +5,7 @@ Reduces code duplication across manager classes.
 import os
 import json
 import logging
+import time
 from typing import Any, Dict, List, Optional
 from .utils import FileBackupManager
 from .constants import DATA_DIR
@@ -45,7 +46,6 @@ class BaseManager:
         """Get age of data file in seconds"""
         try:
             if os.path.exists(self.data_file):
-                import time
                 return time.time() - os.path.getmtime(self.data_file)
             return float('inf')
         except Exception as e:
@@ -4,15 +4,31 @@ import json
 # Telegram Bot Configuration
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')  # Remove default value to ensure proper error handling
 USERS_FILE = os.path.join('data', 'users.json')
+USERS_SAVE_DELAY = 0.5  # seconds to batch user list changes into one write
+# Optional private chat that broadcasts are posted to once and then copied from
+BROADCAST_SOURCE_CHAT_ID = os.getenv('BROADCAST_SOURCE_CHAT_ID')
 
 # Application Configuration
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
+MAX_RETRY_DELAY = 60  # seconds, cap for backoff and server Retry-After waits
 REQUEST_TIMEOUT = 30  # seconds
+MAX_CONCURRENT_SENDS = 20  # Parallel Telegram sends per broadcast (Telegram allows ~30 msg/s)
+GLOBAL_SEND_RATE = 30  # Messages per second across all chats (Telegram bot limit)
+PER_CHAT_SEND_RATE = 1  # Messages per second to a single chat
+TELEGRAM_CONNECTION_POOL_SIZE = 32  # Bot API connections; above MAX_CONCURRENT_SENDS so commands aren't starved by a broadcast
+TELEGRAM_POOL_TIMEOUT = 10.0  # seconds to wait for a free connection before failing a send
 
 # Cache Configuration
 CACHE_MAX_AGE_MINUTES = 360  # 6 hours - threshold to consider cache as old
 CACHE_REFRESH_THRESHOLD_MINUTES = 120  # 2 hours - threshold to show refresh button
+COMPANY_UPDATES_CACHE_TTL = 600  # 10 minutes - reuse a company's cached updates on button clicks
+COMPANY_UPDATES_FLUSH_DELAY = 5  # seconds to batch button-click update writes before saving
+
+# Scheduling
+UPDATE_CHECK_HOURS = (15, 16, 17)  # Weekday hours (server time) for scheduled update checks
+RSS_CHECK_INTERVAL = 15 * 60  # seconds between scheduled RSS checks
+CAMPAIGN_CHECK_INTERVAL = 10 * 60  # seconds between scheduled campaign checks
 
 # Data Storage
 DATA_DIR = "data"
@@ -27,6 +43,7 @@ BACKUP_SENT_DOCUMENTS_FILE = os.path.join(DATA_DIR, "sent_documents.json.bak")
 MINTOS_API_BASE = "https://www.mintos.com/webapp/api/marketplace-api/v1"
 MINTOS_CAMPAIGNS_URL = "https://www.mintos.com/webapp/api/en/webapp-api/user/campaigns"
 REQUEST_DELAY = 0.1  # seconds between requests
+MAX_CONCURRENT_REQUESTS = 10  # Parallel lender requests in fetch_all_updates
 
 # Proxy Configuration
 PROXY_HOST = os.getenv('PROXY_HOST', 'geo.iproyal.com:12321')
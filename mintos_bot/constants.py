@@ -58,6 +58,7 @@ LOG_LEVEL = 'INFO'
 # Rate Limiting
 MAX_CONCURRENT_REQUESTS = 5
 REQUEST_DELAY = 0.5  # seconds between requests
+DOCUMENT_SCRAPE_CONCURRENCY = 10  # company pages fetched at once while scraping documents
 
 # Environment Variables
 TELEGRAM_BOT_TOKEN_VAR = 'TELEGRAM_BOT_TOKEN'
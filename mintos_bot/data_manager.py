@@ -7,8 +7,10 @@ import json
 import logging
 import os
 import shutil
+import threading
 import time
-from typing import Dict, List, Optional, Set, Any, Union
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Any, Tuple, Union
 import pandas as pd
 from .base_manager import BaseManager
 from .constants import (
@@ -26,9 +28,24 @@ class DataManager(BaseManager):
         """Initialize DataManager with necessary data structures"""
         super().__init__(UPDATES_FILE)
         self.company_names: Dict[int, str] = {}
+        self.lender_ids: Tuple[int, ...] = ()
+        self.company_names_sorted: Tuple[Tuple[int, str], ...] = ()  # (id, name) ordered by name
+        self.company_names_version = 0  # Bumped whenever company_names is reloaded
+        # Name lookups are hit once per update and recipient; cleared whenever company_names reloads
+        self._company_name_memo: Dict[Any, str] = {}
         self.sent_updates: Set[str] = set()
         self.sent_campaigns: Set[str] = set()
         self.pending_campaigns: List[Dict[str, Any]] = []
+        # Parsed updates file and indexes over it, each tagged with the (mtime_ns, size) it was built from
+        self._updates_memo: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
+        self._campaigns_memo: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
+        self._updates_date_index: Optional[Tuple[Tuple[int, int], Dict[str, List[Dict[str, Any]]]]] = None
+        self._updates_lender_index: Optional[Tuple[Tuple[int, int], Dict[Any, Dict[str, Any]]]] = None
+        self._update_fetched_at: Dict[Any, float] = {}  # lender_id -> time its updates were last fetched
+        # Full and per-lender saves run in different worker threads; the generation is bumped
+        # by every full save so per-lender writes staged before it can be dropped
+        self._updates_save_lock = threading.Lock()
+        self.updates_generation = 0
         
         # File paths for tracking sent items
         self.sent_updates_file = SENT_UPDATES_FILE
@@ -53,19 +70,28 @@ class DataManager(BaseManager):
             # Try package data first, then local file
             csv_path = self._find_data_file('lo_names.csv', COMPANY_NAMES_CSV)
             self.company_names: Dict[int, str] = {}
+            self.lender_ids: Tuple[int, ...] = ()
+            self.company_names_sorted: Tuple[Tuple[int, str], ...] = ()
 
             if csv_path and os.path.exists(csv_path):
                 try:
                     df = pd.read_csv(csv_path)
-                    self.company_names = df.set_index('id')['name'].to_dict()
+                    # Native int keys: pandas yields numpy int64, which hashes and compares slower
+                    self.company_names = {int(lender_id): name for lender_id, name in zip(df['id'], df['name'])}
+                    self.lender_ids = tuple(self.company_names)
+                    self.company_names_sorted = tuple(sorted(self.company_names.items(), key=lambda item: (item[1], item[0])))
                     logger.info(f"Loaded {len(self.company_names)} company names from {csv_path}")
-                    logger.debug(f"Company IDs loaded: {list(self.company_names.keys())}")
+                    logger.debug("Company IDs loaded: %s", self.lender_ids)
                 except pd.errors.EmptyDataError:
                     logger.warning(f"CSV file {csv_path} is empty")
                 except pd.errors.ParserError:
                     logger.warning(f"Could not parse CSV file {csv_path}")
             else:
                 logger.warning(f"CSV file {COMPANY_NAMES_CSV} not found")
+
+            # The names were reset above even if loading failed, so derived caches are stale either way
+            self.company_names_version += 1
+            self._company_name_memo.clear()
         except Exception as e:
             logger.error(f"Error loading company names: {e}", exc_info=True)
 
@@ -160,9 +186,15 @@ class DataManager(BaseManager):
 
     def save_sent_update(self, update: Dict[str, Any]) -> None:
         """Mark an update as sent with backup and timestamp"""
+        self.save_sent_updates([update])
+
+    def save_sent_updates(self, updates: List[Dict[str, Any]]) -> None:
+        """Mark several updates as sent with one read and write of the sent updates file"""
+        if not updates:
+            return
         try:
-            update_id = self._create_update_id(update)
-            self.sent_updates.add(update_id)
+            update_ids = [self._create_update_id(update) for update in updates]
+            self.sent_updates.update(update_ids)
             
             # Load existing data
             sent_data = []
@@ -174,26 +206,25 @@ class DataManager(BaseManager):
             except (FileNotFoundError, json.JSONDecodeError):
                 pass
                 
-            # Add or update entry
+            # Add or update entries
             now = time.time()
-            updated = False
-            for entry in sent_data:
-                if entry.get('id') == update_id:
+            entries_by_id = {entry.get('id'): entry for entry in sent_data}
+            for update_id in update_ids:
+                entry = entries_by_id.get(update_id)
+                if entry is not None:
                     entry['timestamp'] = now
-                    updated = True
-                    break
-            
-            if not updated:
-                sent_data.append({'id': update_id, 'timestamp': now})
+                else:
+                    entries_by_id[update_id] = entry = {'id': update_id, 'timestamp': now}
+                    sent_data.append(entry)
 
             # Save to both main and backup files
             for file_path in [self.sent_updates_file, self.backup_sent_updates_file]:
                 with open(file_path, 'w') as f:
                     json.dump(sent_data, f)
 
-            logger.info(f"Saved sent update ID: {update_id}")
+            logger.info(f"Saved sent update IDs: {', '.join(update_ids)}")
         except Exception as e:
-            logger.error(f"Error saving sent update: {e}", exc_info=True)
+            logger.error(f"Error saving sent updates: {e}", exc_info=True)
 
     def is_update_sent(self, update: Dict[str, Any]) -> bool:
         """Check if an update has already been sent on the same day"""
@@ -336,23 +367,191 @@ class DataManager(BaseManager):
         return self.get_file_age()
 
     def load_previous_updates(self) -> List[Dict[str, Any]]:
-        """Load previous updates from cache file"""
+        """Load previous updates from cache file
+
+        The parsed list is kept in memory and reused until the file's mtime
+        or size changes, so repeated /today and /company lookups skip the JSON parse.
+        """
+        file_key = self._updates_file_key()
+        if file_key is not None and self._updates_memo and self._updates_memo[0] == file_key:
+            return list(self._updates_memo[1])
+
         updates = self.load_data([])
         logger.info(f"Loaded {len(updates)} company updates from cache")
-        return updates
+        if file_key is not None:
+            self._updates_memo = (file_key, updates)
+        return list(updates)
+
+    def _updates_file_key(self) -> Optional[Tuple[int, int]]:
+        """Get the (mtime_ns, size) identifying the current updates file version"""
+        return self._file_key(self.data_file)
+
+    @staticmethod
+    def _file_key(path: str) -> Optional[Tuple[int, int]]:
+        """Get the (mtime_ns, size) identifying a file's current version, None if missing"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def invalidate_updates_cache(self) -> None:
+        """Drop the parsed updates and their indexes so the next read reloads the file"""
+        self._updates_memo = self._updates_date_index = self._updates_lender_index = None
+
+    def _remember_saved_updates(self, updates: List[Dict[str, Any]],
+                                by_lender: Optional[Dict[Any, Dict[str, Any]]] = None) -> None:
+        """Seed the memo and indexes from just-saved updates instead of rereading the file"""
+        file_key = self._updates_file_key()
+        if file_key is not None:
+            self._updates_memo = (file_key, list(updates))
+            self._updates_date_index = (file_key, self._build_date_index(updates))
+            if by_lender is None:
+                by_lender = {update.get('lender_id'): update for update in updates}
+            self._updates_lender_index = (file_key, by_lender)
 
     def save_updates(self, updates: List[Dict[str, Any]]) -> None:
         """Save updates to cache file"""
-        if self.save_data(updates):
-            logger.info(f"Successfully saved {len(updates)} updates")
+        with self._updates_save_lock:
+            self.updates_generation += 1
+            self.invalidate_updates_cache()
+            if self.save_data(updates):
+                self._remember_saved_updates(updates)
+                now = time.time()
+                self._update_fetched_at = {update.get('lender_id'): now for update in updates}
+                logger.info(f"Successfully saved {len(updates)} updates")
+            else:
+                logger.error("Failed to save updates")
+                raise Exception("Failed to save updates")
+
+    def get_updates_for_date(self, date_str: str) -> List[Dict[str, Any]]:
+        """Get cached update items dated date_str (YYYY-MM-DD)
+
+        Each result is the item merged with its lender_id, company_name and
+        year data. The date index is built once per cache file version, so
+        lookups don't walk every company, year and item again.
+        """
+        updates = self.load_previous_updates()
+        file_key = self._updates_memo[0] if self._updates_memo else None
+
+        if file_key is not None and self._updates_date_index and self._updates_date_index[0] == file_key:
+            by_date = self._updates_date_index[1]
         else:
-            logger.error("Failed to save updates")
-            raise Exception("Failed to save updates")
+            by_date = self._build_date_index(updates)
+            if file_key is not None:
+                self._updates_date_index = (file_key, by_date)
+
+        return list(by_date.get(date_str, []))
+
+    def _build_date_index(self, updates: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Group every cached update item by its date"""
+        by_date: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for company_update in updates:
+            if not isinstance(company_update, dict) or "items" not in company_update:
+                logger.warning(f"Skipping malformed company update: {type(company_update)}")
+                continue
+
+            lender_id = company_update.get('lender_id')
+            if not lender_id:
+                logger.warning("Missing lender_id in company update")
+                continue
+
+            company_name = self.get_company_name(lender_id)
+            for year_data in company_update["items"]:
+                if not isinstance(year_data, dict):
+                    logger.warning(f"Invalid year_data format: {type(year_data)}")
+                    continue
+
+                items = year_data.get("items", [])
+                if not isinstance(items, list):
+                    logger.warning(f"Invalid items format: {type(items)}")
+                    continue
+
+                for item in items:
+                    if item.get('date'):
+                        by_date[item['date']].append({
+                            "lender_id": lender_id,
+                            "company_name": company_name,
+                            **year_data,
+                            **item
+                        })
+
+        logger.debug(f"Indexed cached updates by {len(by_date)} dates")
+        return dict(by_date)
+
+    def load_previous_updates_indexed(self) -> Dict[Any, Dict[str, Any]]:
+        """Load previous updates keyed by lender_id, keeping file order"""
+        return dict(self._get_lender_index())
+
+    def get_updates_for_lender(self, lender_id: Any) -> Optional[Dict[str, Any]]:
+        """Get the cached updates of a single lender, or None if not cached"""
+        return self._get_lender_index().get(lender_id)
+
+    def _get_lender_index(self) -> Dict[Any, Dict[str, Any]]:
+        """Get cached updates keyed by lender_id, built once per cache file version"""
+        updates = self.load_previous_updates()
+        file_key = self._updates_memo[0] if self._updates_memo else None
+
+        if file_key is not None and self._updates_lender_index and self._updates_lender_index[0] == file_key:
+            return self._updates_lender_index[1]
+
+        by_lender = {update.get('lender_id'): update for update in updates}
+        if file_key is not None:
+            self._updates_lender_index = (file_key, by_lender)
+        return by_lender
+
+    def save_update_for(self, lender_id: int, company_updates: Dict[str, Any]) -> None:
+        """Insert or replace the cached updates of a single lender"""
+        self.save_updates_for({lender_id: company_updates})
+
+    def save_updates_for(self, updates_by_lender: Dict[Any, Dict[str, Any]], generation: Optional[int] = None) -> None:
+        """Insert or replace the cached updates of several lenders in one write
+
+        Args:
+            updates_by_lender: Updates to store, keyed by lender_id
+            generation: updates_generation the updates were staged in; if a full
+                save_updates has run since, they are older than the cache and dropped
+        """
+        if not updates_by_lender:
+            return
+        with self._updates_save_lock:
+            if generation is not None and generation != self.updates_generation:
+                logger.info(f"Dropping staged updates for lenders {list(updates_by_lender)}, superseded by a full update check")
+                return
+            by_lender = self.load_previous_updates_indexed()
+            by_lender.update(updates_by_lender)  # Replaced in place, keeping file order
+            updates = list(by_lender.values())
+            self.invalidate_updates_cache()
+            if not self.save_data(updates):
+                logger.error(f"Failed to save updates for lenders {list(updates_by_lender)}")
+                raise Exception("Failed to save updates")
+            self._remember_saved_updates(updates, by_lender)
+            now = time.time()
+            for lender_id in updates_by_lender:
+                self._update_fetched_at[lender_id] = now
+
+    def get_entry_age(self, lender_id: Any) -> float:
+        """Get seconds since a lender's cached updates were fetched (inf if unknown)"""
+        fetched_at = self._update_fetched_at.get(lender_id)
+        if fetched_at is None:
+            return float('inf')
+        return time.time() - fetched_at
 
     def get_company_name(self, lender_id: Any) -> str:
         """Get company name by lender ID, falling back to ID if name not found"""
         try:
-            lender_id = int(lender_id)
+            return self._company_name_memo[lender_id]
+        except KeyError:
+            name = self._company_name_memo[lender_id] = self._lookup_company_name(lender_id)
+            return name
+        except TypeError:  # Unhashable lender_id, can't be memoized
+            return self._lookup_company_name(lender_id)
+
+    def _lookup_company_name(self, lender_id: Any) -> str:
+        """Resolve a company name from company_names (uncached)"""
+        try:
+            if type(lender_id) is not int:
+                lender_id = int(lender_id)
             name = self.company_names.get(lender_id)
             if name is None:
                 logger.debug(f"Company name not found for lender_id: {lender_id}, using ID")
@@ -366,7 +565,8 @@ class DataManager(BaseManager):
         """Compare updates to find new ones"""
         logger.debug(f"Comparing {len(new_updates)} new updates with {len(previous_updates)} previous updates")
 
-        new_updates_dict = {}
+        # Raw items only; the merged update dict is built just for the ones that changed
+        new_items = {}
         for update in new_updates:
             if "items" not in update:
                 continue
@@ -374,19 +574,8 @@ class DataManager(BaseManager):
             lender_id = update.get('lender_id')
             for year_data in update["items"]:
                 year = year_data.get('year')
-                status = year_data.get('status')
-                substatus = year_data.get('substatus')
-
                 for item in year_data.get("items", []):
-                    key = (lender_id, year, item.get('date', ''))
-                    new_updates_dict[key] = {
-                        'lender_id': lender_id,
-                        'year': year,
-                        'status': status,
-                        'substatus': substatus,
-                        'company_name': self.get_company_name(lender_id),
-                        **item
-                    }
+                    new_items[(lender_id, year, item.get('date', ''))] = (year_data, item)
 
         prev_updates_dict = {}
         for update in previous_updates:
@@ -399,9 +588,18 @@ class DataManager(BaseManager):
                         prev_updates_dict[key] = item
 
         added_updates = []
-        for key, update in new_updates_dict.items():
-            if key not in prev_updates_dict or not self._updates_match(update, prev_updates_dict[key]):
-                added_updates.append(update)
+        for key, (year_data, item) in new_items.items():
+            previous_item = prev_updates_dict.get(key)
+            if previous_item is None or not self._updates_match(item, previous_item):
+                lender_id, year, _ = key
+                added_updates.append({
+                    'lender_id': lender_id,
+                    'year': year,
+                    'status': year_data.get('status'),
+                    'substatus': year_data.get('substatus'),
+                    'company_name': self.get_company_name(lender_id),
+                    **item
+                })
 
         logger.info(f"Found {len(added_updates)} new updates")
         return added_updates
@@ -472,8 +670,6 @@ class DataManager(BaseManager):
 
     def add_pending_campaign(self, campaign: Dict[str, Any], admin_notified: bool = False) -> None:
         """Add a campaign to pending notifications with timestamp"""
-        import time
-        
         pending_item = {
             'campaign': campaign,
             'timestamp': time.time(),
@@ -486,8 +682,6 @@ class DataManager(BaseManager):
 
     def get_ready_pending_campaigns(self, delay_hours: int = 4) -> List[Dict[str, Any]]:
         """Get campaigns that are ready to be sent (older than delay_hours)"""
-        import time
-        
         current_time = time.time()
         delay_seconds = delay_hours * 3600
         ready_campaigns = []
@@ -521,13 +715,20 @@ class DataManager(BaseManager):
             return float('inf')
     
     def load_previous_campaigns(self):
-        """Load previous campaigns from cache file"""
+        """Load previous campaigns from cache file
+
+        Like the updates, the parsed list is reused until the file's mtime or size changes.
+        """
         try:
-            if os.path.exists(CAMPAIGNS_FILE):
+            file_key = self._file_key(CAMPAIGNS_FILE)
+            if file_key is not None:
+                if self._campaigns_memo and self._campaigns_memo[0] == file_key:
+                    return list(self._campaigns_memo[1])
                 with open(CAMPAIGNS_FILE, 'r') as f:
                     campaigns = json.load(f)
                 logger.info(f"Loaded {len(campaigns)} campaigns from cache")
-                return campaigns
+                self._campaigns_memo = (file_key, campaigns)
+                return list(campaigns)
             logger.info("No previous campaigns found")
             return []
         except Exception as e:
@@ -537,8 +738,13 @@ class DataManager(BaseManager):
     def save_campaigns(self, campaigns):
         """Save campaigns to cache file"""
         try:
+            self._campaigns_memo = None
             with open(CAMPAIGNS_FILE, 'w') as f:
                 json.dump(campaigns, f, indent=4)
+            # Write-through: the next load reuses what was just saved
+            file_key = self._file_key(CAMPAIGNS_FILE)
+            if file_key is not None:
+                self._campaigns_memo = (file_key, list(campaigns))
             logger.info(f"Successfully saved {len(campaigns)} campaigns")
             logger.debug(f"Campaigns file size: {os.path.getsize(CAMPAIGNS_FILE)} bytes")
         except Exception as e:
@@ -9,17 +9,24 @@ import json
 import logging
 import asyncio
 import aiohttp
+import hashlib
 import re
 import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union, Set
+from typing import Dict, List, Any, Optional, Union, Set, Tuple
+from urllib.parse import urljoin
 from bs4 import BeautifulSoup, Tag
 import pandas as pd
 
+try:
+    import lxml  # Optional: C-backed HTML parser for BeautifulSoup, much faster than html.parser
+except ImportError:
+    lxml = None
+
 from .constants import (
     DATA_DIR, DOCUMENTS_CACHE_FILE, SENT_DOCUMENTS_FILE, SENT_DOCUMENTS_BACKUP,
     COMPANY_PAGES_CSV, DOCUMENT_TYPES, MAX_HTTP_RETRIES, HTTP_RETRY_DELAY,
-    HTTP_CLIENT_TIMEOUT, DEFAULT_USER_AGENT, DOCUMENT_CACHE_TTL
+    HTTP_CLIENT_TIMEOUT, DEFAULT_USER_AGENT, DOCUMENT_CACHE_TTL, DOCUMENT_SCRAPE_CONCURRENCY
 )
 from .config import PROXY_HOST, PROXY_AUTH, USE_PROXY
 from .utils import safe_get_text, safe_get_attribute, safe_find, safe_find_all, FileBackupManager, create_unique_id
@@ -27,6 +34,38 @@ from .utils import safe_get_text, safe_get_attribute, safe_find, safe_find_all,
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Relative document links on company pages resolve against the site root
+MINTOS_BASE_URL = 'https://www.mintos.com/'
+
+# BeautifulSoup parser for company pages
+HTML_PARSER = 'lxml' if lxml else 'html.parser'
+
+# Date formats searched for near a document link, most specific first
+DOCUMENT_DATE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'Last Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'Date:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'(\d{1,2}\.\d{1,2}\.\d{4})',
+    r'(\d{4}-\d{2}-\d{2})'
+)]
+
+# Page date lookup: elements whose text mentions an update/date label, the date formats
+# tried in each such element (in priority order), then formats tried on the whole page
+DATE_LABEL_RE = re.compile(r'(Last\s+Updated|Updated|Date)', re.I)
+LABELLED_DATE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'Last Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'Last Updated:?\s*(\d{4}-\d{1,2}-\d{1,2})',
+    r'Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'Updated:?\s*(\d{4}-\d{1,2}-\d{1,2})',
+    r'Date:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
+    r'Date:?\s*(\d{4}-\d{1,2}-\d{1,2})'
+)]
+PAGE_DATE_PATTERNS = [re.compile(pattern) for pattern in (
+    r'(\d{1,2}\.\d{1,2}\.\d{4})',
+    r'(\d{4}-\d{2}-\d{2})',
+    r'(\d{1,2}/\d{1,2}/\d{4})'
+)]
+
 class DocumentScraper:
     """Scrapes and manages document information from company pages"""
 
@@ -34,9 +73,16 @@ class DocumentScraper:
         """Initialize the document scraper"""
         self.data_dir = DATA_DIR
         self.documents_cache_file = DOCUMENTS_CACHE_FILE
+        self._documents_memo: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]]]] = None
         self.sent_documents_file = SENT_DOCUMENTS_FILE
         self.sent_documents_backup_file = SENT_DOCUMENTS_BACKUP
         self.document_types = DOCUMENT_TYPES
+        # Lowercase link text of each document type, e.g. 'loan_agreement' -> 'loan agreement'
+        self.document_type_labels = {doc_type: doc_type.replace('_', ' ').lower() for doc_type in DOCUMENT_TYPES}
+        self.document_type_by_label = {label: doc_type for doc_type, label in self.document_type_labels.items()}
+        self._session: Optional[aiohttp.ClientSession] = None  # Shared across page fetches, created lazily
+        # (company, url) -> (page content digest, day, documents) from the last parse of each page
+        self._parsed_pages: Dict[Tuple[str, str], Tuple[bytes, str, List[Dict[str, Any]]]] = {}
         
         # Company pages mapping
         self.company_pages = []
@@ -239,16 +285,33 @@ class DocumentScraper:
             return float('inf')
 
     def load_previous_documents(self) -> List[Dict[str, Any]]:
-        """Load previous documents from cache file"""
+        """Load previous documents from cache file
+
+        The parsed list is kept in memory and reused until the cache file's mtime
+        or size changes, so the JSON is only re-parsed after it changes.
+        """
         try:
-            if os.path.exists(self.documents_cache_file):
-                with open(self.documents_cache_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return []
+            try:
+                stat = os.stat(self.documents_cache_file)
+            except FileNotFoundError:
+                return []
+
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            if self._documents_memo and self._documents_memo[0] == file_key:
+                return list(self._documents_memo[1])
+
+            documents = self._parse_documents_file()
+            self._documents_memo = (file_key, documents)
+            return list(documents)
         except Exception as e:
             logger.error(f"Error loading previous documents: {e}")
             return []
 
+    def _parse_documents_file(self) -> List[Dict[str, Any]]:
+        """Parse the documents cache file"""
+        with open(self.documents_cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
     def save_documents(self, documents: List[Dict[str, Any]]) -> None:
         """Save documents to cache file"""
         try:
@@ -284,10 +347,10 @@ class DocumentScraper:
             logger.error(f"Error comparing documents: {e}")
             return []
 
-    async def extract_date_from_page(self, html_content: str) -> Optional[str]:
-        """Extract document date from HTML content"""
+    async def extract_date_from_page(self, html_content: Union[str, BeautifulSoup]) -> Optional[str]:
+        """Extract document date from HTML content or an already parsed page"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = html_content if isinstance(html_content, BeautifulSoup) else BeautifulSoup(html_content, HTML_PARSER)
             today = datetime.now().strftime('%Y-%m-%d')
             
             # First, try to find the most reliable indicator - table cell with "Last Updated" label
@@ -300,22 +363,13 @@ class DocumentScraper:
                         return self._normalize_date(date_text)
             
             # Next, try to find any span, div, or p element containing the text "Last Updated"
-            update_elements = soup.find_all(['span', 'div', 'p'], string=re.compile(r'(Last\s+Updated|Updated|Date)', re.I))
+            update_elements = soup.find_all(['span', 'div', 'p'], string=DATE_LABEL_RE)
             
             # Look for common date patterns in these elements
-            date_patterns = [
-                r'Last Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
-                r'Last Updated:?\s*(\d{4}-\d{1,2}-\d{1,2})',
-                r'Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
-                r'Updated:?\s*(\d{4}-\d{1,2}-\d{1,2})',
-                r'Date:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
-                r'Date:?\s*(\d{4}-\d{1,2}-\d{1,2})'
-            ]
-            
             for element in update_elements:
                 text = element.get_text().strip()
-                for pattern in date_patterns:
-                    match = re.search(pattern, text)
+                for pattern in LABELLED_DATE_PATTERNS:
+                    match = pattern.search(text)
                     if match:
                         date_str = match.group(1)
                         normalized_date = self._normalize_date(date_str)
@@ -324,14 +378,8 @@ class DocumentScraper:
             
             # As a last resort, search for date patterns in the entire page text
             text = soup.get_text()
-            general_date_patterns = [
-                r'(\d{1,2}\.\d{1,2}\.\d{4})',
-                r'(\d{4}-\d{2}-\d{2})',
-                r'(\d{1,2}/\d{1,2}/\d{4})'
-            ]
-            
-            for pattern in general_date_patterns:
-                match = re.search(pattern, text)
+            for pattern in PAGE_DATE_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     date_str = match.group(1)
                     normalized_date = self._normalize_date(date_str)
@@ -385,31 +433,43 @@ class DocumentScraper:
             logger.error(f"Error normalizing date {date_str}: {e}")
             return date_str  # Return original if parsing fails
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use
+
+        The company pages all live on mintos.com, so one session lets the scraping
+        loop reuse its connections instead of a new TCP/TLS handshake per page.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=HTTP_CLIENT_TIMEOUT,
+                headers={'User-Agent': DEFAULT_USER_AGENT},
+                # One host, at most DOCUMENT_SCRAPE_CONCURRENCY pages in flight; cache its DNS lookup
+                connector=aiohttp.TCPConnector(limit_per_host=DOCUMENT_SCRAPE_CONCURRENCY, ttl_dns_cache=300)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def fetch_page(self, url: str) -> Optional[str]:
         """Fetch a web page with error handling and retries"""
-        headers = {
-            'User-Agent': DEFAULT_USER_AGENT
-        }
-        
-        # Configure connector
-        connector_kwargs = {}
+        # Configure proxy if enabled
+        proxy = None
         if USE_PROXY and PROXY_HOST and PROXY_AUTH:
             logger.debug(f"Using proxy for document scraping: {PROXY_HOST}")
+            proxy = f'http://{PROXY_AUTH}@{PROXY_HOST}'
         
+        session = self._get_session()
         for attempt in range(MAX_HTTP_RETRIES):
             try:
-                connector = aiohttp.TCPConnector(**connector_kwargs)
-                async with aiohttp.ClientSession(timeout=HTTP_CLIENT_TIMEOUT, connector=connector) as session:
-                    # Configure proxy if enabled
-                    proxy = None
-                    if USE_PROXY and PROXY_HOST and PROXY_AUTH:
-                        proxy = f'http://{PROXY_AUTH}@{PROXY_HOST}'
-                    
-                    async with session.get(url, headers=headers, proxy=proxy) as response:
-                        if response.status == 200:
-                            return await response.text()
-                        else:
-                            logger.warning(f"Failed to fetch {url}: HTTP {response.status}")
+                async with session.get(url, proxy=proxy) as response:
+                    if response.status == 200:
+                        return await response.text()
+                    else:
+                        logger.warning(f"Failed to fetch {url}: HTTP {response.status}")
                             
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logger.warning(f"Error fetching {url} (attempt {attempt+1}/{MAX_HTTP_RETRIES}): {e}")
@@ -424,32 +484,22 @@ class DocumentScraper:
     async def scrape_documents(self) -> List[Dict[str, Any]]:
         """Scrape document information from company pages"""
         all_documents = []
+        logger.info(f"Processing {len(self.company_pages)} companies, {DOCUMENT_SCRAPE_CONCURRENCY} at a time")
         
-        # Process in batches to avoid timeouts
-        batch_size = 10
+        # A sliding window rather than fixed batches: a slow page only holds up its own
+        # slot instead of stalling the next batch of companies
+        semaphore = asyncio.Semaphore(DOCUMENT_SCRAPE_CONCURRENCY)
+
+        async def process(company: Dict[str, str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._process_company(company['Company'], company['URL'])
+
+        results = await asyncio.gather(*(process(company) for company in self.company_pages))
         
-        for i in range(0, len(self.company_pages), batch_size):
-            batch = self.company_pages[i:i + batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}/{(len(self.company_pages) + batch_size - 1)//batch_size}: {len(batch)} companies")
-            
-            # Create tasks for this batch
-            tasks = []
-            for company in batch:
-                company_name = company['Company']
-                url = company['URL']
-                task = self._process_company(company_name, url)
-                tasks.append(task)
-            
-            # Run tasks concurrently
-            batch_results = await asyncio.gather(*tasks)
-            
-            # Add results to all_documents
-            for result in batch_results:
-                if result:
-                    all_documents.extend(result)
-            
-            # Sleep briefly between batches to avoid overwhelming the server
-            await asyncio.sleep(1)
+        # Results come back in company_pages order
+        for result in results:
+            if result:
+                all_documents.extend(result)
         
         logger.info(f"Scraped {len(all_documents)} documents from {len(self.company_pages)} companies")
         return all_documents
@@ -465,88 +515,100 @@ class DocumentScraper:
                 logger.error(f"Failed to fetch page for {company_name}")
                 return []
             
+            # Unchanged pages (e.g. a refresh the same day) reuse the documents parsed last time.
+            # The day is part of the key because undated pages fall back to today's date
+            page_key = (company_name, url)
+            digest = hashlib.blake2b(html_content.encode(), digest_size=16).digest()
+            today = datetime.now().strftime('%Y-%m-%d')
+            cached = self._parsed_pages.get(page_key)
+            if cached and cached[0] == digest and cached[1] == today:
+                logger.debug("Page for %s unchanged since last parse, reusing its documents", company_name)
+                return [dict(doc) for doc in cached[2]]
+            
+            # Parse HTML once, for both the page date and the documents
+            soup = BeautifulSoup(html_content, HTML_PARSER)
+            
             # Extract page date
-            page_date = await self.extract_date_from_page(html_content)
+            page_date = await self.extract_date_from_page(soup)
             logger.debug(f"Page date for {company_name}: {page_date}")
             
-            # Parse HTML
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
             # Extract documents
             documents = []
             
-            # Look for exact matches first (most reliable)
+            # Look for exact matches first (most reliable): the first PDF link whose text
+            # is a document type's label, found in a single pass over the page's links
+            exact_matches: Dict[str, Tuple[Any, str, str]] = {}
+            for link in soup.find_all('a', href=True):
+                link_text = safe_get_text(link)
+                doc_type = self.document_type_by_label.get(link_text.lower())
+                if doc_type and doc_type not in exact_matches:
+                    href = safe_get_attribute(link, 'href')
+                    if href.endswith('.pdf'):
+                        exact_matches[doc_type] = (link, link_text, href)
+
             for doc_type in self.document_types:
-                doc_type_display = doc_type.replace('_', ' ').title()
+                if doc_type not in exact_matches:
+                    continue
+                link, link_text, href = exact_matches[doc_type]
+                logger.debug(f"Found exact match for {doc_type}: {href}")
                 
-                # Find links with matching text
-                for link in soup.find_all('a', href=True):
-                    link_text = safe_get_text(link)
-                    href = safe_get_attribute(link, 'href')
-                    
-                    if link_text.lower() == doc_type_display.lower() and href.endswith('.pdf'):
-                        logger.debug(f"Found exact match for {doc_type}: {href}")
-                        
-                        # Try to extract date from context
-                        specific_date = None
-                        parent = link.parent
-                        
-                        # Look for dates in parent elements
-                        for _ in range(3):  # Look up to 3 levels up
-                            if parent:
-                                parent_text = parent.get_text()
-                                for pattern in [
-                                    r'Last Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
-                                    r'Updated:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
-                                    r'Date:?\s*(\d{1,2}[./]\d{1,2}[./]\d{2,4})',
-                                    r'(\d{1,2}\.\d{1,2}\.\d{4})',
-                                    r'(\d{4}-\d{2}-\d{2})'
-                                ]:
-                                    match = re.search(pattern, parent_text)
-                                    if match:
-                                        specific_date = self._normalize_date(match.group(1))
-                                        break
-                                parent = parent.parent
-                                if specific_date:
-                                    break
-                        
-                        # Make sure we have an absolute URL
-                        if not href.startswith('http'):
-                            href = f"https://www.mintos.com{href}" if href.startswith('/') else f"https://www.mintos.com/{href}"
-                        
-                        # Create document entry
-                        doc = {
-                            'company_name': company_name,
-                            'type': doc_type,
-                            'title': link_text,
-                            'url': href,
-                            'company_page_url': url,
-                            'date': specific_date if specific_date else page_date
-                        }
-                        
-                        documents.append(doc)
-                        break  # Found this document type, move to next
+                # Try to extract date from context
+                specific_date = None
+                parent = link.parent
+                
+                # Look for dates in parent elements
+                for _ in range(3):  # Look up to 3 levels up
+                    if parent:
+                        parent_text = parent.get_text()
+                        for pattern in DOCUMENT_DATE_PATTERNS:
+                            match = pattern.search(parent_text)
+                            if match:
+                                specific_date = self._normalize_date(match.group(1))
+                                break
+                        parent = parent.parent
+                        if specific_date:
+                            break
+                
+                # Make sure we have an absolute URL
+                href = urljoin(MINTOS_BASE_URL, href)
+                
+                # Create document entry
+                doc = {
+                    'company_name': company_name,
+                    'type': doc_type,
+                    'title': link_text,
+                    'url': href,
+                    'company_page_url': url,
+                    'date': specific_date if specific_date else page_date
+                }
+                
+                documents.append(doc)
             
             # If we haven't found all document types, try other strategies
             found_types = {doc['type'] for doc in documents}
             missing_types = set(self.document_types) - found_types
             
             if missing_types:
-                # Try the document container approach - look for sections with multiple document types
-                card_containers = soup.find_all('div')
+                # Try the document container approach - look for sections with multiple document types.
+                # Only divs enclosing a PDF link can yield documents, so the (costly) text of every
+                # other div is never extracted
+                is_pdf_href = lambda h: h and h.lower().endswith('.pdf')
+                pdf_link_containers = {
+                    id(parent)
+                    for link in soup.find_all('a', href=is_pdf_href)
+                    for parent in link.parents
+                    if parent.name == 'div'
+                }
+                card_containers = [div for div in soup.find_all('div') if id(div) in pdf_link_containers]
                 for container in card_containers:
                     # Check if this is likely a document container
                     container_text = container.get_text().lower()
-                    matches = 0
-                    for doc_type in self.document_types:
-                        doc_text = doc_type.replace('_', ' ').lower()
-                        if doc_text in container_text:
-                            matches += 1
+                    matches = sum(doc_label in container_text for doc_label in self.document_type_labels.values())
                     
                     # If this container mentions multiple document types, extract PDF links
                     if matches >= 2:
                         # Look for links to PDF files
-                        pdf_links = container.find_all('a', href=lambda h: h and h.lower().endswith('.pdf'))
+                        pdf_links = container.find_all('a', href=is_pdf_href)
                         
                         # Try to match links to document types
                         for link in pdf_links:
@@ -555,19 +617,15 @@ class DocumentScraper:
                             
                             # Find which document type this matches
                             matched_type = None
+                            link_text_lower = link_text.lower()
                             for doc_type in missing_types:
-                                doc_text = doc_type.replace('_', ' ').lower()
-                                if doc_text == link_text.lower() or doc_text in link_text.lower():
+                                if self.document_type_labels[doc_type] in link_text_lower:
                                     matched_type = doc_type
                                     break
                             
                             if matched_type:
                                 # Make sure we have an absolute URL
-                                if not href.startswith(('http://', 'https://')):
-                                    if href.startswith('/'):
-                                        href = f"https://www.mintos.com{href}"
-                                    else:
-                                        href = f"https://www.mintos.com/{href}"
+                                href = urljoin(MINTOS_BASE_URL, href)
                                 
                                 # Create document entry
                                 doc = {
@@ -590,6 +648,7 @@ class DocumentScraper:
             for doc in documents:
                 logger.debug(f"  - {doc['type']}: {doc['title']} ({doc['date']})")
             
+            self._parsed_pages[page_key] = (digest, today, [dict(doc) for doc in documents])
             return documents
             
         except Exception as e:
@@ -600,7 +659,7 @@ class DocumentScraper:
         """Check for document updates and return new documents"""
         try:
             # Load previous documents
-            previous_documents = self.load_previous_documents()
+            previous_documents = await asyncio.to_thread(self.load_previous_documents)
             logger.info(f"Loaded {len(previous_documents)} previous documents")
             
             # Scrape current documents
@@ -2,66 +2,92 @@
 Mintos API Client
 Handles communication with the Mintos marketplace API.
 """
-import requests
+import random
+import threading
 import time
-from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+import httpx
+from typing import Dict, List, Optional, Any, Sequence, Union
 from .logger import setup_logger
 from .config import (
     MINTOS_API_BASE,
     MINTOS_CAMPAIGNS_URL,
     REQUEST_DELAY,
+    MAX_CONCURRENT_REQUESTS,
     MAX_RETRIES,
     RETRY_DELAY,
+    MAX_RETRY_DELAY,
     REQUEST_TIMEOUT,
     PROXY_HOST,
     PROXY_AUTH,
     USE_PROXY
 )
 
+try:
+    import h2  # Optional (httpx[http2]): multiplex the parallel lender fetches over one connection
+except ImportError:
+    h2 = None
+
 logger = setup_logger(__name__)
 
 class MintosClient:
     """Client for interacting with Mintos API"""
 
     def __init__(self):
-        """Initialize client with session"""
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; Mintos Monitor Bot/1.0)',
-            'Accept': 'application/json'
-        })
-        
+        """Initialize client; the pooled HTTP client is opened on the first request"""
         # Configure proxy if enabled
         if USE_PROXY and PROXY_HOST and PROXY_AUTH:
-            self.proxies = {
-                'http': f'http://{PROXY_AUTH}@{PROXY_HOST}',
-                'https': f'http://{PROXY_AUTH}@{PROXY_HOST}'
-            }
+            self.proxy = f'http://{PROXY_AUTH}@{PROXY_HOST}'
             logger.info(f"Proxy configured: {PROXY_HOST}")
         else:
-            self.proxies = None
+            self.proxy = None
             logger.info("No proxy configured")
 
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """Get the pooled HTTP client, creating it on first use or after close()
+
+        Shared by the fetch_all_updates workers (httpx clients are thread-safe). With h2
+        installed their requests are multiplexed over HTTP/2 instead of one
+        HTTP/1.1 connection per worker.
+        """
+        with self._client_lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    http2=h2 is not None,
+                    limits=httpx.Limits(max_connections=MAX_CONCURRENT_REQUESTS, max_keepalive_connections=MAX_CONCURRENT_REQUESTS),
+                    timeout=REQUEST_TIMEOUT,
+                    follow_redirects=True,  # requests.Session followed redirects by default
+                    proxy=self.proxy,
+                    headers={
+                        'User-Agent': 'Mozilla/5.0 (compatible; Mintos Monitor Bot/1.0)',
+                        'Accept': 'application/json'
+                    },
+                )
+            return self._client
+
+    def close(self) -> None:
+        """Close the pooled HTTP client; the next request opens a new one"""
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
     def _make_request(self, url: str, method: str = 'GET', **kwargs) -> Optional[Dict[str, Any]]:
         """Make an HTTP request with retries and error handling"""
-        # Add proxy configuration to kwargs if available
-        if self.proxies:
-            kwargs['proxies'] = self.proxies
-            
         for attempt in range(MAX_RETRIES):
             try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    timeout=REQUEST_TIMEOUT,
-                    **kwargs
-                )
+                response = self._get_client().request(method=method, url=url, **kwargs)
                 response.raise_for_status()
                 return response.json()
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 logger.error(f"API request failed, attempt {attempt + 1}/{MAX_RETRIES}: {str(e)}")
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY * (attempt + 1))  # Exponential backoff
+                    response = e.response if isinstance(e, httpx.HTTPStatusError) else None
+                    time.sleep(self._retry_delay(attempt, response))
                 continue
             except Exception as e:
                 logger.error(f"Unexpected error in API request: {str(e)}")
@@ -70,6 +96,28 @@ class MintosClient:
                 continue
         return None
 
+    @staticmethod
+    def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+        """Get seconds to wait before retrying a failed request
+
+        Honors the server's Retry-After on 429/503, otherwise backs off exponentially
+        with jitter so parallel workers don't retry in lockstep.
+        """
+        if response is not None and response.status_code in (429, 503):
+            retry_after = response.headers.get('Retry-After')
+            if retry_after:
+                try:
+                    delay = float(retry_after)
+                except ValueError:  # HTTP-date form
+                    try:
+                        delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                    except (TypeError, ValueError):
+                        delay = None
+                if delay is not None:
+                    logger.warning(f"Server asked to retry after {retry_after}")
+                    return min(max(delay, 0), MAX_RETRY_DELAY)
+        return min(RETRY_DELAY * 2 ** attempt + random.uniform(0, 1), MAX_RETRY_DELAY)
+
     def get_recovery_updates(self, lender_id: Union[int, str]) -> Optional[Dict[str, Any]]:
         """Get recovery updates for a specific lender
 
@@ -89,25 +137,31 @@ class MintosClient:
         logger.error(f"Failed to get updates for lender {lender_id} after {MAX_RETRIES} attempts")
         return None
 
-    def fetch_all_updates(self, lender_ids: List[Union[int, str]]) -> List[Dict[str, Any]]:
+    def _fetch_lender_updates(self, lender_id: Union[int, str]) -> Optional[Dict[str, Any]]:
+        """Fetch one lender's updates for fetch_all_updates, tagged with its lender_id"""
+        try:
+            recovery_data = self.get_recovery_updates(lender_id)
+            time.sleep(REQUEST_DELAY)
+            if recovery_data:
+                return {"lender_id": lender_id, **recovery_data}
+        except Exception as e:
+            logger.error(f"Error fetching updates for lender {lender_id}: {str(e)}")
+        return None
+
+    def fetch_all_updates(self, lender_ids: Sequence[Union[int, str]]) -> List[Dict[str, Any]]:
         """Fetch updates for multiple lenders
 
+        Up to MAX_CONCURRENT_REQUESTS lenders are fetched in parallel; results
+        keep the order of lender_ids.
+
         Args:
-            lender_ids: List of lender IDs to fetch updates for
+            lender_ids: Lender IDs to fetch updates for
 
         Returns:
             List of updates for all lenders
         """
-        updates = []
-        for lender_id in lender_ids:
-            try:
-                recovery_data = self.get_recovery_updates(lender_id)
-                if recovery_data:
-                    updates.append({"lender_id": lender_id, **recovery_data})
-                time.sleep(REQUEST_DELAY)
-            except Exception as e:
-                logger.error(f"Error fetching updates for lender {lender_id}: {str(e)}")
-                continue
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            updates = [update for update in executor.map(self._fetch_lender_updates, lender_ids) if update]
 
         logger.info(f"Fetched updates for {len(updates)} out of {len(lender_ids)} lenders")
         return updates
@@ -8,6 +8,7 @@ Handles fetching, filtering, and processing of RSS feeds from:
 import asyncio
 import aiohttp
 import feedparser
+import json
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional, Set
 import re
@@ -17,6 +18,9 @@ import os
 
 logger = setup_logger(__name__)
 
+# Leading "Company - ..." / "Company: ..." prefix in NASDAQ descriptions
+ISSUER_PREFIX_RE = re.compile(r'^([^-:]+)[-:]')
+
 class RSSItem:
     """Represents a single RSS news item"""
     def __init__(self, title: str, link: str, pub_date: str, guid: str, issuer: str, feed_source: str = "nasdaq"):
@@ -102,6 +106,7 @@ class RSSReader(BaseManager):
         self.keywords: Set[str] = set()
         self.sent_items: Set[str] = set()
         self.user_preferences: Dict[str, bool] = {}
+        self._session: Optional[aiohttp.ClientSession] = None  # Shared across feed fetches, created lazily
         
         # Load existing data
         self._load_keywords()
@@ -135,7 +140,6 @@ class RSSReader(BaseManager):
         """Load last check timestamps for each feed"""
         try:
             if os.path.exists(self.last_check_file):
-                import json
                 with open(self.last_check_file, 'r') as f:
                     data = json.load(f)
                     for feed, timestamp in data.items():
@@ -148,7 +152,6 @@ class RSSReader(BaseManager):
     def _save_last_check_times(self) -> None:
         """Save last check timestamps for each feed"""
         try:
-            import json
             os.makedirs(os.path.dirname(self.last_check_file), exist_ok=True)
             data = {}
             for feed, timestamp in self.last_check_times.items():
@@ -209,7 +212,6 @@ class RSSReader(BaseManager):
         try:
             if os.path.exists(self.sent_items_file):
                 with open(self.sent_items_file, 'r') as f:
-                    import json
                     data = json.load(f)
                     self.sent_items = set(data)
                 logger.info(f"Loaded {len(self.sent_items)} sent RSS items")
@@ -224,7 +226,6 @@ class RSSReader(BaseManager):
         try:
             os.makedirs(os.path.dirname(self.sent_items_file), exist_ok=True)
             with open(self.sent_items_file, 'w') as f:
-                import json
                 json.dump(list(self.sent_items), f, indent=2)
             logger.info(f"Saved {len(self.sent_items)} sent RSS items")
         except Exception as e:
@@ -235,7 +236,6 @@ class RSSReader(BaseManager):
         try:
             if os.path.exists(self.user_preferences_file):
                 with open(self.user_preferences_file, 'r') as f:
-                    import json
                     self.user_preferences = json.load(f)
                 logger.info(f"Loaded RSS preferences for {len(self.user_preferences)} users")
             else:
@@ -249,7 +249,6 @@ class RSSReader(BaseManager):
         try:
             os.makedirs(os.path.dirname(self.user_preferences_file), exist_ok=True)
             with open(self.user_preferences_file, 'w') as f:
-                import json
                 json.dump(self.user_preferences, f, indent=2)
             logger.info(f"Saved RSS preferences for {len(self.user_preferences)} users")
         except Exception as e:
@@ -305,16 +304,32 @@ class RSSReader(BaseManager):
             # For NASDAQ and other feeds, check title and issuer
             text_to_check = f"{item.title} {item.issuer}".lower()
         
-        logger.debug(f"Checking {item.feed_source} RSS item: '{text_to_check}' against keywords: {self.keywords}")
+        logger.debug("Checking %s RSS item: '%s' against keywords: %s", item.feed_source, text_to_check, self.keywords)
         
         for keyword in self.keywords:
             if keyword in text_to_check:
-                logger.debug(f"RSS item matched keyword '{keyword}': {item.title}")
+                logger.debug("RSS item matched keyword '%s': %s", keyword, item.title)
                 return True
         
-        logger.debug(f"RSS item did not match any keywords: {item.title}")
+        logger.debug("RSS item did not match any keywords: %s", item.title)
         return False
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use
+
+        Reusing one session keeps connections to the feed hosts alive between
+        checks instead of paying a new TCP/TLS handshake for every fetch.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def fetch_single_feed(self, feed_source: str, url: str) -> List[RSSItem]:
         """Fetch and parse a single RSS feed"""
         try:
@@ -324,100 +339,87 @@ class RSSReader(BaseManager):
             config = self.feed_configs.get(feed_source, {})
             use_proxy = config.get('use_proxy', True)
             
-            timeout = aiohttp.ClientTimeout(total=30)
-            
-            # Configure session with or without proxy
-            connector_kwargs = {}
-            session_kwargs = {'timeout': timeout}
-            
             if use_proxy:
                 # Use proxy for NASDAQ Baltic feed
-                try:
-                    proxy_url = os.getenv('PROXY_URL')
-                    if proxy_url:
-                        session_kwargs['connector'] = aiohttp.TCPConnector()
-                        logger.debug(f"Using proxy for {feed_source} feed")
-                    else:
-                        logger.debug(f"No proxy configured for {feed_source} feed")
-                except Exception as e:
-                    logger.warning(f"Proxy setup failed for {feed_source}: {e}")
+                if os.getenv('PROXY_URL'):
+                    logger.debug(f"Using proxy for {feed_source} feed")
+                else:
+                    logger.debug(f"No proxy configured for {feed_source} feed")
             else:
                 logger.debug(f"Bypassing proxy for {feed_source} feed")
             
-            async with aiohttp.ClientSession(**session_kwargs) as session:
-                # Add proxy to request if configured
-                request_kwargs = {}
-                if use_proxy:
-                    proxy_url = os.getenv('PROXY_URL')
-                    if proxy_url:
-                        request_kwargs['proxy'] = proxy_url
-                
-                async with session.get(url, **request_kwargs) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        feed = feedparser.parse(content)
-                        
-                        items = []
-                        for entry in feed.entries:
-                            try:
-                                title = entry.title if hasattr(entry, 'title') else 'No title'
-                                
-                                # Handle different feed structures
-                                if feed_source == "mintos":
-                                    issuer = "Mintos"
-                                elif feed_source == "ffnews":
-                                    issuer = entry.author if hasattr(entry, 'author') else "FF News"
-                                else:  # nasdaq
-                                    # Try to extract issuer from different RSS fields
-                                    issuer = 'Unknown issuer'
-                                    if hasattr(entry, 'issuer'):
-                                        issuer = entry.issuer
-                                    elif hasattr(entry, 'author'):
-                                        issuer = entry.author
-                                    elif hasattr(entry, 'description'):
-                                        # Try to extract company name from description
-                                        description = entry.description
-                                        import re
-                                        match = re.search(r'^([^-:]+)[-:]', description)
-                                        if match:
-                                            issuer = match.group(1).strip()
-                                    elif hasattr(entry, 'summary'):
-                                        # Try to extract from summary
-                                        summary = entry.summary
-                                        import re
-                                        match = re.search(r'^([^-:]+)[-:]', summary)
-                                        if match:
-                                            issuer = match.group(1).strip()
-                                    
-                                    # Also try to extract issuer from title if it contains company patterns
-                                    if issuer == 'Unknown issuer':
-                                        title_lower = title.lower()
-                                        for keyword in self.keywords:
-                                            if keyword.lower() in title_lower:
-                                                issuer = keyword
-                                                break
-                                
-                                logger.debug(f"{feed_source} RSS entry - Title: '{title}', Issuer: '{issuer}'")
+            session = self._get_session()
+            # Add proxy to request if configured
+            request_kwargs = {}
+            if use_proxy:
+                proxy_url = os.getenv('PROXY_URL')
+                if proxy_url:
+                    request_kwargs['proxy'] = proxy_url
+            
+            async with session.get(url, **request_kwargs) as response:
+                if response.status == 200:
+                    content = await response.text()
+                    feed = feedparser.parse(content)
+                    
+                    items = []
+                    for entry in feed.entries:
+                        try:
+                            title = entry.title if hasattr(entry, 'title') else 'No title'
+                            
+                            # Handle different feed structures
+                            if feed_source == "mintos":
+                                issuer = "Mintos"
+                            elif feed_source == "ffnews":
+                                issuer = entry.author if hasattr(entry, 'author') else "FF News"
+                            else:  # nasdaq
+                                # Try to extract issuer from different RSS fields
+                                issuer = 'Unknown issuer'
+                                if hasattr(entry, 'issuer'):
+                                    issuer = entry.issuer
+                                elif hasattr(entry, 'author'):
+                                    issuer = entry.author
+                                elif hasattr(entry, 'description'):
+                                    # Try to extract company name from description
+                                    description = entry.description
+                                    match = ISSUER_PREFIX_RE.search(description)
+                                    if match:
+                                        issuer = match.group(1).strip()
+                                elif hasattr(entry, 'summary'):
+                                    # Try to extract from summary
+                                    summary = entry.summary
+                                    match = ISSUER_PREFIX_RE.search(summary)
+                                    if match:
+                                        issuer = match.group(1).strip()
                                 
-                                item = RSSItem(
-                                    title=title,
-                                    link=entry.link,
-                                    pub_date=entry.published,
-                                    guid=entry.guid,
-                                    issuer=issuer,
-                                    feed_source=feed_source
-                                )
-                                items.append(item)
-                            except Exception as e:
-                                logger.warning(f"Error parsing {feed_source} RSS entry: {e}")
-                                continue
-                        
-                        logger.info(f"Fetched {len(items)} items from {feed_source}")
-                        return items
-                    else:
-                        logger.error(f"{feed_source} RSS feed fetch failed with status: {response.status}")
-                        return []
-                        
+                                # Also try to extract issuer from title if it contains company patterns
+                                if issuer == 'Unknown issuer':
+                                    title_lower = title.lower()
+                                    for keyword in self.keywords:
+                                        if keyword.lower() in title_lower:
+                                            issuer = keyword
+                                            break
+                            
+                            logger.debug("%s RSS entry - Title: '%s', Issuer: '%s'", feed_source, title, issuer)
+                            
+                            item = RSSItem(
+                                title=title,
+                                link=entry.link,
+                                pub_date=entry.published,
+                                guid=entry.guid,
+                                issuer=issuer,
+                                feed_source=feed_source
+                            )
+                            items.append(item)
+                        except Exception as e:
+                            logger.warning(f"Error parsing {feed_source} RSS entry: {e}")
+                            continue
+                    
+                    logger.info(f"Fetched {len(items)} items from {feed_source}")
+                    return items
+                else:
+                    logger.error(f"{feed_source} RSS feed fetch failed with status: {response.status}")
+                    return []
+                    
         except Exception as e:
             logger.error(f"Error fetching {feed_source} RSS feed: {e}")
             return []
@@ -428,18 +430,23 @@ class RSSReader(BaseManager):
         feeds_checked = []
         
         # Check each feed individually based on its update frequency
+        due_feeds = []
         for feed_source, url in self.feed_urls.items():
             if self._should_check_feed(feed_source):
                 logger.info(f"Checking {feed_source} feed (due for update)")
-                items = await self.fetch_single_feed(feed_source, url)
-                all_items.extend(items)
-                feeds_checked.append(feed_source)
-                
-                # Update last check time for this feed
-                self.last_check_times[feed_source] = datetime.now(timezone.utc)
+                due_feeds.append((feed_source, url))
             else:
                 logger.debug(f"Skipping {feed_source} feed (not due for update yet)")
         
+        # The feeds live on different hosts, so fetch them concurrently over the shared session
+        feed_items = await asyncio.gather(*(self.fetch_single_feed(feed_source, url) for feed_source, url in due_feeds))
+        for (feed_source, _), items in zip(due_feeds, feed_items):
+            all_items.extend(items)
+            feeds_checked.append(feed_source)
+            
+            # Update last check time for this feed
+            self.last_check_times[feed_source] = datetime.now(timezone.utc)
+        
         # Save updated check times if any feeds were checked
         if feeds_checked:
             self._save_last_check_times()
@@ -453,10 +460,10 @@ class RSSReader(BaseManager):
         """Force fetch all RSS feeds regardless of timing (for admin use)"""
         all_items = []
         
-        # Force check all feeds
-        for feed_source, url in self.feed_urls.items():
-            logger.info(f"Force checking {feed_source} feed for admin")
-            items = await self.fetch_single_feed(feed_source, url)
+        # Force check all feeds, concurrently
+        logger.info(f"Force checking {', '.join(self.feed_urls)} feeds for admin")
+        feed_items = await asyncio.gather(*(self.fetch_single_feed(feed_source, url) for feed_source, url in self.feed_urls.items()))
+        for items in feed_items:
             all_items.extend(items)
         
         logger.info(f"Force fetched total of {len(all_items)} RSS items from {len(self.feed_urls)} feeds")
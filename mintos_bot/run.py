@@ -3,11 +3,11 @@
 Main entry point for the Mintos Telegram Bot
 Simple startup script that handles configuration and launches the bot.
 """
-import asyncio
 import sys
 import os
 import logging
 from .config_loader import load_telegram_token, create_sample_config
+from .utils import run_event_loop
 
 # Set up basic logging
 logging.basicConfig(
@@ -59,7 +59,7 @@ def main():
             spec = importlib.util.spec_from_file_location("run", run_path)
             run_module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(run_module)
-            asyncio.run(run_module.main())
+            run_event_loop(run_module.main())
         else:
             # Fallback to direct bot import with Streamlit
             import subprocess
@@ -102,7 +102,7 @@ def main():
                 await bot.run()
             
             try:
-                asyncio.run(run_bot())
+                run_event_loop(run_bot())
             finally:
                 if streamlit_process:
                     streamlit_process.terminate()
@@ -116,7 +116,7 @@ def main():
             bot = MintosBot()
             await bot.run()
         
-        asyncio.run(run_bot())
+        run_event_loop(run_bot())
     except KeyboardInterrupt:
         print("\nBot stopped by user")
         return 0
@@ -1,32 +1,151 @@
 from __future__ import annotations
 import asyncio
-from datetime import datetime, timezone
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+import functools
 import time
 import html
 import hashlib
 import os
-from typing import Optional, List, Dict, Any, Union, cast, TypedDict
-from telegram import Bot, Update, InlineKeyboardButton, InlineKeyboardMarkup
+import re
+from typing import Optional, List, Dict, Any, Tuple, Union, cast, TypedDict
+from telegram import Bot, Update, InlineKeyboardButton, InlineKeyboardMarkup, LinkPreviewOptions
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters, ContextTypes
-from telegram.error import TelegramError, Conflict, Forbidden, BadRequest, RetryAfter
+from telegram.error import TelegramError, Conflict, Forbidden, BadRequest, RetryAfter, NetworkError, TimedOut
 import math
 
+try:
+    import h2  # Optional (httpx[http2]): lets concurrent sends share one multiplexed connection
+except ImportError:
+    h2 = None
+
 from .logger import setup_logger
 from .config import (
     TELEGRAM_TOKEN, 
     UPDATES_FILE, 
     CAMPAIGNS_FILE, 
     DOCUMENT_SCRAPE_INTERVAL_HOURS,
-    DOCUMENT_TYPES
+    DOCUMENT_TYPES,
+    MAX_CONCURRENT_SENDS,
+    GLOBAL_SEND_RATE,
+    PER_CHAT_SEND_RATE,
+    TELEGRAM_CONNECTION_POOL_SIZE,
+    TELEGRAM_POOL_TIMEOUT,
+    COMPANY_UPDATES_CACHE_TTL,
+    COMPANY_UPDATES_FLUSH_DELAY,
+    UPDATE_CHECK_HOURS,
+    RSS_CHECK_INTERVAL,
+    CAMPAIGN_CHECK_INTERVAL,
+    BROADCAST_SOURCE_CHAT_ID
 )
 from .data_manager import DataManager
 from .mintos_client import MintosClient
 from .document_scraper import DocumentScraper
 from .user_manager import UserManager
 from .rss_reader import RSSReader
+from .utils import AsyncRateLimiter, batched, join_under_limit, run_event_loop, sleep_until_next_tick
 
 logger = setup_logger(__name__)
 
+# Precompiled patterns used when formatting campaigns and parsing user input
+HTML_TAG_RE = re.compile(r'<[^>]*>')
+MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+MULTI_SPACE_RE = re.compile(r'\s{2,}')
+DATE_INPUT_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+# company_<id>, latest_<id> and all_<id>[_<page>] callback data
+COMPANY_CALLBACK_RE = re.compile(r'(company|latest|all)_(\d+)(?:_(\d+))?')
+
+# Entities and tags cleaned from recovery update descriptions in a single pass
+UPDATE_DESCRIPTION_REPLACEMENTS = {
+    '&#39;': "'",
+    '&rsquo;': "'",
+    '&euro;': '€',
+    '&nbsp;': ' ',
+    '<br>': '\n',
+    '<br/>': '\n',
+    '<br />': '\n',
+    '<p>': '',
+    '</p>': '\n',
+}
+UPDATE_DESCRIPTION_RE = re.compile('|'.join(map(re.escape, UPDATE_DESCRIPTION_REPLACEMENTS)))
+
+# Campaign descriptions: entities are decoded first, then block tags become line breaks
+CAMPAIGN_ENTITY_REPLACEMENTS = {
+    '&#39;': "'",
+    '&rsquo;': "'",
+    '&euro;': '€',
+    '&nbsp;': ' ',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&amp;': '&',
+}
+CAMPAIGN_ENTITY_RE = re.compile('|'.join(map(re.escape, CAMPAIGN_ENTITY_REPLACEMENTS)))
+CAMPAIGN_TAG_REPLACEMENTS = {
+    '<br>': '\n',
+    '<br/>': '\n',
+    '<br />': '\n',
+    '</p>': '\n',
+    '</div>': '\n',
+    '</li>': '\n',
+    '<li>': '• ',  # Preserve list formatting
+}
+CAMPAIGN_TAG_RE = re.compile('|'.join(map(re.escape, CAMPAIGN_TAG_REPLACEMENTS)))
+
+# re.sub replacement functions looking matches up in the tables above
+def _update_description_replacement(match: re.Match) -> str:
+    return UPDATE_DESCRIPTION_REPLACEMENTS[match.group()]
+
+def _campaign_entity_replacement(match: re.Match) -> str:
+    return CAMPAIGN_ENTITY_REPLACEMENTS[match.group()]
+
+def _campaign_tag_replacement(match: re.Match) -> str:
+    return CAMPAIGN_TAG_REPLACEMENTS[match.group()]
+
+def clean_update_description(description: str) -> str:
+    """Decode entities and turn paragraph/line-break tags into newlines in one pass"""
+    return UPDATE_DESCRIPTION_RE.sub(_update_description_replacement, description).strip()
+
+# Link appended to update and campaign messages
+MINTOS_CAMPAIGNS_LINK = "🔗 <a href='https://www.mintos.com/en/campaigns/'>View on Mintos</a>"
+
+# Shared by every send that disables link previews, instead of PTB building one per call
+NO_LINK_PREVIEW = LinkPreviewOptions(is_disabled=True)
+
+# Static admin keyboards, shared instead of rebuilt on every callback
+ADMIN_PANEL_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("👥 View Users", callback_data="admin_users")],
+    [InlineKeyboardButton("🔄 Refresh Updates", callback_data="admin_refresh_updates")],
+    [InlineKeyboardButton("📄 Refresh Documents", callback_data="admin_refresh_documents")],
+    [InlineKeyboardButton("📤 Send Updates", callback_data="admin_trigger_today")],
+    [InlineKeyboardButton("📰 Send RSS Items", callback_data="admin_send_rss")],
+    [InlineKeyboardButton("❌ Exit", callback_data="admin_exit")]
+])
+ADMIN_BACK_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]])
+
+@functools.lru_cache(maxsize=256)
+def company_options_markup(company_id: int) -> InlineKeyboardMarkup:
+    """Get the Latest/All updates keyboard of a company, built once per company"""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton("Latest Update", callback_data=f"latest_{company_id}")],
+        [InlineKeyboardButton("All Updates", callback_data=f"all_{company_id}_0")]
+    ])
+
+# Update fields read by format_update_message; together they key the render cache
+UPDATE_MESSAGE_FIELDS = (
+    'company_name', 'date', 'year', 'status', 'substatus',
+    'recoveredAmount', 'remainingAmount', 'expectedRecoveryFrom', 'expectedRecoveryTo',
+    'expectedRecoveryYearFrom', 'expectedRecoveryYearTo', 'description', 'lender_id'
+)
+
+# Campaign fields read by format_campaign_message; together they key the render cache
+CAMPAIGN_MESSAGE_FIELDS = (
+    'id', 'name', 'type', 'shortDescription', 'bonusAmount', 'bonusCoefficient',
+    'requiredPrincipalExposure', 'additionalBonusEnabled', 'additionalBonusDays',
+    'validFrom', 'validTo', 'termsConditionsLink'
+)
+_MISSING = object()
+
 class YearItem(TypedDict, total=False):
     year: int
     status: str
@@ -46,7 +165,9 @@ class MintosBot:
     Implements singleton pattern and provides comprehensive update tracking.
     """
     _instance: Optional['MintosBot'] = None
-    _lock = asyncio.Lock()
+    # Created on first use inside a running loop; asyncio locks can't be shared across loops
+    _lock: Optional[asyncio.Lock] = None
+    _lock_loop: Optional[asyncio.AbstractEventLoop] = None
     _initialized = False
     _polling_task: Optional[asyncio.Task] = None
     _update_task: Optional[asyncio.Task] = None
@@ -62,6 +183,15 @@ class MintosBot:
             cls._initialized = False  # Force reinitialization
         return cls._instance
 
+    @classmethod
+    def _init_lock(cls) -> asyncio.Lock:
+        """Get the initialization lock for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if cls._lock is None or cls._lock_loop is not loop:
+            cls._lock = asyncio.Lock()
+            cls._lock_loop = loop
+        return cls._lock
+
     async def __aenter__(self) -> 'MintosBot':
         await self.initialize()
         return self
@@ -85,10 +215,20 @@ class MintosBot:
             self.user_manager = UserManager()
             self.document_scraper = DocumentScraper()
             self.rss_reader = RSSReader()
+            self._company_name = self.data_manager.get_company_name  # Memoized by DataManager
+            # The same update is rendered on every check and /company lookup, so memoize by content
+            self._render_update_fields = functools.lru_cache(maxsize=1024)(self._render_update_fields_uncached)
+            self._render_campaign_fields = functools.lru_cache(maxsize=256)(self._render_campaign_fields_uncached)
+            # Token buckets keeping sends within Telegram's global and per-chat limits
+            self._global_send_limiter = AsyncRateLimiter(GLOBAL_SEND_RATE)
+            self._chat_send_limiters: Dict[str, AsyncRateLimiter] = defaultdict(lambda: AsyncRateLimiter(PER_CHAT_SEND_RATE))
             self._polling_task: Optional[asyncio.Task] = None
             self._update_task: Optional[asyncio.Task] = None
             self._campaign_task: Optional[asyncio.Task] = None
             self._rss_task: Optional[asyncio.Task] = None
+            # Company updates fetched on button clicks, written to disk in batches
+            self._pending_company_updates: Dict[int, Dict[str, Any]] = {}
+            self._flush_task: Optional[asyncio.Task] = None
             self._is_startup_check = True  # Flag to indicate first check after startup
             self._initialized = True
             logger.info("Bot instance created")
@@ -98,14 +238,18 @@ class MintosBot:
         try:
             logger.info("Starting cleanup process...")
             await self._cancel_tasks()
+            await self._flush_company_updates()
             await self._cleanup_application()
+            await self.rss_reader.close()
+            await self.document_scraper.close()
+            self.mintos_client.close()
             logger.info("Cleanup completed successfully")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}", exc_info=True)
 
     async def _cancel_tasks(self) -> None:
         """Cancel running background tasks"""
-        for task_name, task in [("polling", self._polling_task), ("update", self._update_task), ("campaign", self._campaign_task), ("rss", self._rss_task)]:
+        for task_name, task in [("polling", self._polling_task), ("update", self._update_task), ("campaign", self._campaign_task), ("rss", self._rss_task), ("flush", self._flush_task)]:
             if task and not task.done():
                 task.cancel()
                 try:
@@ -114,13 +258,35 @@ class MintosBot:
                     pass
                 setattr(self, f"_{task_name}_task", None)
 
+    def _stage_company_updates(self, company_id: int, company_updates: Dict[str, Any]) -> None:
+        """Queue a company's fetched updates for the next batched save"""
+        self._pending_company_updates[company_id] = company_updates
+        if not self._flush_task or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self) -> None:
+        """Save staged company updates once clicks have had time to accumulate"""
+        await asyncio.sleep(COMPANY_UPDATES_FLUSH_DELAY)
+        await self._flush_company_updates()
+
+    async def _flush_company_updates(self) -> None:
+        """Write all staged company updates in a single save"""
+        if not self._pending_company_updates:
+            return
+        pending, self._pending_company_updates = self._pending_company_updates, {}
+        generation = self.data_manager.updates_generation
+        try:
+            await asyncio.to_thread(self.data_manager.save_updates_for, pending, generation)
+            logger.debug("Saved updates for %d companies", len(pending))
+        except Exception as e:
+            logger.error(f"Error saving company updates: {e}", exc_info=True)
+
     async def _cleanup_application(self) -> None:
         """Clean up the Telegram application instance"""
         if self.application:
             try:
                 if hasattr(self.application, 'updater') and self.application.updater and self.application.updater.running:
                     await self.application.updater.stop()
-                    await asyncio.sleep(1)
 
                 if hasattr(self.application, 'bot') and self.application.bot:
                     await self.application.bot.delete_webhook(drop_pending_updates=True)
@@ -135,18 +301,24 @@ class MintosBot:
 
     async def initialize(self) -> bool:
         """Initialize bot application with handlers"""
-        async with self._lock:
+        async with self._init_lock():
             try:
                 logger.info("Starting bot initialization...")
-                await self.cleanup()
-                await asyncio.sleep(2)  # Wait for cleanup to complete
+                await self.cleanup()  # Awaits the updater and application shutdown
 
                 if not TELEGRAM_TOKEN:
                     logger.error("TELEGRAM_BOT_TOKEN not set")
                     return False
 
                 logger.info("Creating application instance...")
-                self.application = Application.builder().token(TELEGRAM_TOKEN).build()
+                self.application = (
+                    Application.builder()
+                    .token(TELEGRAM_TOKEN)
+                    .connection_pool_size(TELEGRAM_CONNECTION_POOL_SIZE)
+                    .pool_timeout(TELEGRAM_POOL_TIMEOUT)
+                    .http_version("2" if h2 else "1.1")
+                    .build()
+                )
 
                 # Verify bot connection
                 try:
@@ -229,7 +401,7 @@ class MintosBot:
                 user = getattr(update, 'effective_user', None)
                 if user and hasattr(user, 'id'):
                     logger.warning(f"Bot blocked by user {user.id}")
-                    await self.user_manager.remove_user(user.id)
+                    self.user_manager.remove_user(user.id)
             elif isinstance(context.error, Conflict):
                 logger.error("Multiple instance conflict detected")
                 await self.cleanup()
@@ -240,32 +412,35 @@ class MintosBot:
         """Handle scheduled update checks with improved resilience"""
         consecutive_errors = 0
         max_consecutive_errors = 3
-        normal_sleep = 5 * 60  # Regular 5-minute check interval
         error_sleep = 3 * 60   # Shorter 3-minute retry after errors
-        long_sleep = 55 * 60   # 55-minute wait after successful update
+        woke_for_slot = False  # True after sleeping until a scheduled slot
 
         while True:
             try:
-                # Check the current time and stale cache situation
-                should_check = await self.should_check_updates()
+                # After waking for a slot the check is due; otherwise (startup, after a failed
+                # check) check the current time and stale cache situation
+                should_check = woke_for_slot or await self.should_check_updates()
+                woke_for_slot = False
 
                 if should_check:
                     logger.info("Running scheduled update")
-                    try:
-                        await self._safe_update_check()
+                    if await self._safe_update_check():
                         # Reset error counter after successful update
                         consecutive_errors = 0
                         logger.info("Scheduled update completed successfully")
 
                         # Try to resend any failed messages
                         await self.retry_failed_messages()
-
-                        # Use longer sleep interval after successful update
-                        await asyncio.sleep(long_sleep)
-                        continue  # Skip the normal sleep at the end
-                    except Exception as e:
+                    else:
                         consecutive_errors += 1
-                        logger.error(f"Update check failed ({consecutive_errors}/{max_consecutive_errors}): {e}", exc_info=True)
+                        logger.error(f"Update check failed ({consecutive_errors}/{max_consecutive_errors})")
+                        if consecutive_errors == 1:
+                            # Notify once per failure streak, not on every retry
+                            await self._broadcast(
+                                self.user_manager.get_all_users(),
+                                "⚠️ Error occurred while checking for updates",
+                                disable_web_page_preview=True
+                            )
 
                         # Implement exponential backoff for repeated errors
                         if consecutive_errors >= max_consecutive_errors:
@@ -273,25 +448,15 @@ class MintosBot:
                             await asyncio.sleep(error_sleep * consecutive_errors)
                         else:
                             await asyncio.sleep(error_sleep)
-                        continue  # Skip the normal sleep at the end
-                else:
-                    # Check for stale cache during business hours
-                    try:
-                        cache_age_hours = self.data_manager.get_cache_age() / 3600
-                        now = datetime.now()
-                        # If more than 30 hours old on a weekday during business hours, force an update
-                        if (cache_age_hours > 30 and now.weekday() < 5 and 
-                            9 <= now.hour <= 18):  # Business hours (9 AM to 6 PM)
-                            logger.warning(f"Cache file is {cache_age_hours:.1f} hours old - forcing emergency update")
-                            await self._safe_update_check()
-                            consecutive_errors = 0
-                            await asyncio.sleep(long_sleep)
-                            continue
-                    except Exception as e:
-                        logger.error(f"Error checking cache age: {e}")
+                        continue  # Retry (or recover a stale cache) before waiting for the next slot
 
-                # Normal sleep interval between checks
-                await asyncio.sleep(normal_sleep)
+                # Sleep straight through to the next scheduled slot instead of polling;
+                # a failure there starts a new streak (and a new notice)
+                consecutive_errors = 0
+                next_run = self._next_update_time(datetime.now())
+                logger.info(f"Next scheduled update check at {next_run.strftime('%Y-%m-%d %H:%M')}")
+                await asyncio.sleep(max((next_run - datetime.now()).total_seconds(), 0))
+                woke_for_slot = True
 
             except asyncio.CancelledError:
                 logger.info("Scheduled updates cancelled")
@@ -301,23 +466,37 @@ class MintosBot:
                 # Use shorter sleep time when we encounter errors
                 await asyncio.sleep(error_sleep)
 
-    async def _safe_update_check(self) -> None:
-        """Safely perform update check with error handling"""
+    def _next_update_time(self, now: datetime) -> datetime:
+        """Get the next weekday slot at one of UPDATE_CHECK_HOURS strictly after now"""
+        for days_ahead in range(8):
+            day = now + timedelta(days=days_ahead)
+            if day.weekday() >= 5:  # Saturday or Sunday
+                continue
+            for hour in UPDATE_CHECK_HOURS:
+                slot = day.replace(hour=hour, minute=0, second=0, microsecond=0)
+                if slot > now:
+                    return slot
+        raise RuntimeError("No scheduled update slot within a week")
+
+    async def _safe_update_check(self) -> bool:
+        """Safely perform update check with error handling
+
+        Returns:
+            True if the company update check succeeded
+        """
         try:
-            await asyncio.sleep(1)  # Prevent conflicts
-            
             # Check for company updates
-            await self.check_updates()
+            updates_ok = await self.check_updates()
             logger.info("Update check completed")
             
             # Check for document updates
             await self.check_documents()
             logger.info("Document check completed")
             
-
-            
+            return updates_ok
         except Exception as e:
             logger.error(f"Update check error: {e}", exc_info=True)
+            return False
 
     async def run(self) -> None:
         """Run the bot with polling and scheduled updates"""
@@ -329,21 +508,21 @@ class MintosBot:
             try:
                 # Ensure clean state
                 await self.cleanup()
-                await asyncio.sleep(2)
 
                 # Initialize bot
                 if not await self.initialize():
                     logger.error("Bot initialization failed")
                     raise RuntimeError("Bot initialization failed")
 
-                # Start polling in background
+                # Start polling first; start_polling() returns once the updater's fetch
+                # loop is running in the background, so commands are answered before
+                # (and while) the scheduled tasks below do their first checks
                 if self.application and self.application.updater:
-                    self._polling_task = asyncio.create_task(
-                        self.application.updater.start_polling(
-                            drop_pending_updates=True,
-                            allowed_updates=["message", "callback_query"]
-                        )
+                    await self.application.updater.start_polling(
+                        drop_pending_updates=True,
+                        allowed_updates=["message", "callback_query"]
                     )
+                    logger.info("Polling started")
 
                 # Start scheduled updates
                 self._update_task = asyncio.create_task(self.scheduled_updates())
@@ -354,8 +533,16 @@ class MintosBot:
                 # Start RSS updates
                 self._rss_task = asyncio.create_task(self.scheduled_rss_updates())
 
-                # Wait for all tasks
-                await asyncio.gather(self._polling_task, self._update_task, self._campaign_task, self._rss_task)
+                # The scheduled loops run until cancelled, so the first one to finish has
+                # failed; surface that right away instead of waiting on the others.
+                # Cleanup cancels the remaining tasks and stops polling.
+                done, _ = await asyncio.wait(
+                    {self._update_task, self._campaign_task, self._rss_task},
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    task.result()  # Re-raise the task's exception, if any
+                logger.warning("A scheduled task stopped, shutting down")
                 return
 
             except Exception as e:
@@ -391,7 +578,7 @@ class MintosBot:
                 logger.info(f"Start command from channel/group {chat_title} (chat_id: {chat_id})")
                 welcome_message = "🚀 Bot added to channel/group. Updates will be sent here."
                 # Save chat title as the "username" for channels/groups
-                self.user_manager.add_user(str(chat_id), chat_title)
+                await asyncio.to_thread(self.user_manager.add_user, str(chat_id), chat_title)
             else:
                 username = user.username if user else None
                 full_name = f"{user.first_name} {user.last_name if user.last_name else ''}".strip() if user else None
@@ -403,7 +590,7 @@ class MintosBot:
                 welcome_message = self._create_welcome_message(show_admin=is_admin)
                 
                 # Save username for individual users
-                self.user_manager.add_user(str(chat_id), username)
+                await asyncio.to_thread(self.user_manager.add_user, str(chat_id), username)
             await self.send_message(chat_id, welcome_message, disable_web_page_preview=True)
             logger.info(f"Chat {chat_id} registered")
 
@@ -451,28 +638,32 @@ class MintosBot:
                 logger.warning(f"Could not delete command message: {e}")
 
             chat_id = update.effective_chat.id
-            company_buttons = []
-            companies = sorted(self.data_manager.company_names.items(), key=lambda x: x[1])
-            for i in range(0, len(companies), 2):
-                row = []
-                for company_id, company_name in companies[i:i+2]:
-                    row.append(InlineKeyboardButton(
-                        company_name,
-                        callback_data=f"company_{company_id}"
-                    ))
-                company_buttons.append(row)
-
-            company_buttons.append([InlineKeyboardButton("❌ Cancel", callback_data="cancel")])
-            reply_markup = InlineKeyboardMarkup(company_buttons)
             await update.message.reply_text(
                 "Select a company to view updates:",
-                reply_markup=reply_markup,
+                reply_markup=self._get_company_markup(),
                 disable_web_page_preview=True
             )
         except Exception as e:
             logger.error(f"Error in company_command: {e}", exc_info=True)
             await self.send_message(chat_id, "⚠️ Error displaying company list. Please try again.", disable_web_page_preview=True)
 
+    def _get_company_markup(self) -> InlineKeyboardMarkup:
+        """Get the company selection keyboard, rebuilding it only when company names change"""
+        version = self.data_manager.company_names_version
+        if self._company_markup and self._company_markup[0] == version:
+            return self._company_markup[1]
+
+        company_buttons = [
+            [InlineKeyboardButton(company_name, callback_data=f"company_{company_id}")
+             for company_id, company_name in pair]
+            for pair in batched(self.data_manager.company_names_sorted, 2)
+        ]
+        company_buttons.append([InlineKeyboardButton("❌ Cancel", callback_data="cancel")])
+
+        reply_markup = InlineKeyboardMarkup(company_buttons)
+        self._company_markup = (version, reply_markup)
+        return reply_markup
+
     async def handle_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle callback queries from inline keyboard buttons"""
         try:
@@ -485,15 +676,13 @@ class MintosBot:
             if not query.data:
                 return
                 
-            if query.data.startswith("company_"):
-                company_id = int(query.data.split("_")[1])
-                company_name = self.data_manager.get_company_name(company_id)
+            # The company menu buttons are the most frequent callbacks, so they're matched first
+            company_callback = COMPANY_CALLBACK_RE.fullmatch(query.data)
+            if company_callback and company_callback[1] == "company":
+                company_id = int(company_callback[2])
+                company_name = self._company_name(company_id)
 
-                buttons = [
-                    [InlineKeyboardButton("Latest Update", callback_data=f"latest_{company_id}")],
-                    [InlineKeyboardButton("All Updates", callback_data=f"all_{company_id}_0")]
-                ]
-                reply_markup = InlineKeyboardMarkup(buttons)
+                reply_markup = company_options_markup(company_id)
                 if query.message:
                     await query.edit_message_text(
                         f"Select update type for {company_name}:",
@@ -501,6 +690,92 @@ class MintosBot:
                         disable_web_page_preview=True
                 )
 
+            elif company_callback:
+                # latest_<company_id> or all_<company_id>[_<page>]
+                update_type, company_id, page = company_callback.groups()
+                company_id = int(company_id)
+                page = int(page) if page else 0
+                company_name = self._company_name(company_id)
+
+                await query.edit_message_text(f"Fetching latest data for {company_name}...", disable_web_page_preview=True)
+
+                company_updates = self._pending_company_updates.get(company_id)
+                if not company_updates and self.data_manager.get_entry_age(company_id) < COMPANY_UPDATES_CACHE_TTL:
+                    # Fetched recently, serve from cache instead of hitting the API again
+                    company_updates = await asyncio.to_thread(self.data_manager.get_updates_for_lender, company_id)
+
+                if not company_updates:
+                    company_updates = await asyncio.to_thread(self.mintos_client.get_recovery_updates, company_id)
+                    if company_updates:
+                        company_updates = {"lender_id": company_id, **company_updates}
+                        self._stage_company_updates(company_id, company_updates)
+
+                if not company_updates:
+                    await query.edit_message_text(f"No updates found for {company_name}", disable_web_page_preview=True)
+                    return
+
+                if update_type == "latest":
+                    latest_update = {"lender_id": company_id, "company_name": company_name}
+                    if "items" in company_updates and company_updates["items"]:
+                        latest_year = company_updates["items"][0]
+                        if "items" in latest_year and latest_year["items"]:
+                            latest_item = latest_year["items"][0]
+                            latest_update.update(latest_item)
+                    message = self.format_update_message(latest_update)
+                    await query.edit_message_text(message, parse_mode='HTML', disable_web_page_preview=True)
+
+                else:  # all updates
+                    all_updates = []
+                    for year_data in sorted(company_updates.get("items", []), key=lambda x: x.get('year', 0), reverse=True):
+                        # Dates are ISO YYYY-MM-DD, so they sort correctly as strings
+                        year_items = sorted(year_data.get("items", []), key=lambda x: x.get('date', '1900-01-01'), reverse=True)
+                        all_updates.extend(year_items)
+
+                    updates_per_page = 5
+                    total_updates = len(all_updates)
+                    total_pages = (total_updates + updates_per_page - 1) // updates_per_page
+
+                    if page >= total_pages:
+                        page = total_pages - 1
+                    if page < 0:
+                        page = 0
+
+                    start_idx = page * updates_per_page
+                    end_idx = min(start_idx + updates_per_page, total_updates)
+
+                    header_message = (
+                        f"📊 Updates for {company_name}\n"
+                        f"Page {page + 1} of {total_pages}\n"
+                        f"Showing updates {start_idx + 1}-{end_idx} of {total_updates}"
+                    )
+
+                    # Only the current page is merged with the company fields and rendered;
+                    # combine it with the header into as few messages as fit Telegram's length
+                    # limit, since sends to one chat are serialized by its rate limiter anyway
+                    company_fields = {"lender_id": company_id, "company_name": company_name}
+                    current_page_updates = [
+                        self.format_update_message(company_fields | update_item)
+                        for update_item in all_updates[start_idx:end_idx]
+                    ]
+                    chunks = list(join_under_limit([header_message, *current_page_updates]))
+
+                    nav_buttons = []
+                    if page > 0:
+                        nav_buttons.append(InlineKeyboardButton("◀️ Previous", callback_data=f"all_{company_id}_{page-1}"))
+                    if page < total_pages - 1:
+                        nav_buttons.append(InlineKeyboardButton("Next ▶️", callback_data=f"all_{company_id}_{page+1}"))
+                    reply_markup = InlineKeyboardMarkup([nav_buttons]) if nav_buttons else None
+
+                    # The navigation buttons ride on the page's last message, saving a
+                    # separate send (and a per-chat rate limit slot) on every page view
+                    for i, chunk in enumerate(chunks, 1):
+                        await self.send_message(
+                            query.message.chat_id,
+                            chunk,
+                            reply_markup=reply_markup if i == len(chunks) else None,
+                            disable_web_page_preview=True
+                        )
+
             elif query.data == "refresh_cache":
                 chat_id = update.effective_chat.id
                 await query.edit_message_text("🔄 Refreshing updates...", disable_web_page_preview=True)
@@ -586,8 +861,7 @@ class MintosBot:
                     user_text = "No users are currently registered."
                 
                 # Add back button
-                keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
+                reply_markup = ADMIN_BACK_MARKUP
                 
                 await query.edit_message_text(user_text, reply_markup=reply_markup, parse_mode='HTML')
                 return
@@ -639,7 +913,6 @@ class MintosBot:
                 elif query.data == "admin_trigger_today_select" or target_date:
                     # If "Today's Updates" was selected, set today's date
                     if query.data == "admin_trigger_today_select":
-                        import time
                         target_date = time.strftime("%Y-%m-%d")
                     
                     # Get all registered users
@@ -647,8 +920,7 @@ class MintosBot:
                     
                     if not users:
                         # No users found
-                        keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                        reply_markup = InlineKeyboardMarkup(keyboard)
+                        reply_markup = ADMIN_BACK_MARKUP
                         
                         date_text = "Today's" if not target_date else f"{target_date}"
                         await query.edit_message_text(
@@ -715,8 +987,7 @@ class MintosBot:
                     await self._safe_update_check()
                     
                     # Add back button
-                    keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
+                    reply_markup = ADMIN_BACK_MARKUP
                     
                     # Get cache information
                     cache_age_minutes = int(self.data_manager.get_cache_age() / 60) if not math.isinf(self.data_manager.get_cache_age()) else float('inf')
@@ -733,7 +1004,7 @@ class MintosBot:
                             cache_age_text = f"{minutes}m"
                     
                     # Get updates count
-                    updates = self.data_manager.load_previous_updates()
+                    updates = await asyncio.to_thread(self.data_manager.load_previous_updates)
                     update_count = len(updates) if updates else 0
                     
                     await query.edit_message_text(
@@ -748,8 +1019,7 @@ class MintosBot:
                 except Exception as e:
                     logger.error(f"Error refreshing updates: {e}", exc_info=True)
                     # Add back button
-                    keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
+                    reply_markup = ADMIN_BACK_MARKUP
                     
                     await query.edit_message_text(
                         f"⚠️ <b>Error refreshing updates</b>\n\n"
@@ -774,11 +1044,10 @@ class MintosBot:
                 try:
                     await self.check_documents()
                     # Add back button
-                    keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
+                    reply_markup = ADMIN_BACK_MARKUP
                     
-                    # Get documents count information
-                    previous_documents = self.document_scraper.load_previous_documents()
+                    # Get documents count information (file read off the event loop)
+                    previous_documents = await asyncio.to_thread(self.document_scraper.load_previous_documents)
                     doc_count = len(previous_documents)
                     
                     await query.edit_message_text(
@@ -791,8 +1060,7 @@ class MintosBot:
                 except Exception as e:
                     logger.error(f"Error refreshing documents: {e}", exc_info=True)
                     # Add back button
-                    keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                    reply_markup = InlineKeyboardMarkup(keyboard)
+                    reply_markup = ADMIN_BACK_MARKUP
                     
                     await query.edit_message_text(
                         f"⚠️ Error refreshing documents: {str(e)}\n\n"
@@ -894,16 +1162,7 @@ class MintosBot:
                     return
                     
                 # Return to admin panel
-                keyboard = [
-                    [InlineKeyboardButton("👥 View Users", callback_data="admin_users")],
-                    [InlineKeyboardButton("🔄 Refresh Updates", callback_data="admin_refresh_updates")],
-                    [InlineKeyboardButton("📄 Refresh Documents", callback_data="admin_refresh_documents")],
-                    [InlineKeyboardButton("📤 Send Updates", callback_data="admin_trigger_today")],
-                    [InlineKeyboardButton("📰 Send RSS Items", callback_data="admin_send_rss")],
-                    [InlineKeyboardButton("❌ Exit", callback_data="admin_exit")]
-                ]
-                
-                reply_markup = InlineKeyboardMarkup(keyboard)
+                reply_markup = ADMIN_PANEL_MARKUP
                 await query.edit_message_text(
                     "🔐 <b>Admin Control Panel</b>\n\nPlease select an admin function:",
                     reply_markup=reply_markup,
@@ -914,7 +1173,7 @@ class MintosBot:
 
             elif query.data.startswith("rss_toggle_"):
                 # Legacy support - enable/disable all feeds
-                chat_id = query.data.split("_")[2]
+                chat_id = query.data.removeprefix("rss_toggle_")
                 current_preference = self.user_manager.get_rss_preference(chat_id)
                 new_preference = not current_preference
                 self.user_manager.set_rss_preference(chat_id, new_preference)
@@ -1053,7 +1312,7 @@ class MintosBot:
                 
             elif query.data.startswith("rss_feed_select_"):
                 # Handle RSS feed selection
-                feed_source = query.data.replace("rss_feed_select_", "")
+                feed_source = query.data.removeprefix("rss_feed_select_")
                 await self._show_rss_items_for_feed(query, feed_source)
                 return
                 
@@ -1077,95 +1336,6 @@ class MintosBot:
                 )
                 return
 
-            elif query.data.startswith(("latest_", "all_")):
-                parts = query.data.split("_")
-                update_type = parts[0]
-                company_id = int(parts[1])
-                page = int(parts[2]) if len(parts) > 2 else 0
-                company_name = self.data_manager.get_company_name(company_id)
-
-                await query.edit_message_text(f"Fetching latest data for {company_name}...", disable_web_page_preview=True)
-
-                company_updates = self.mintos_client.get_recovery_updates(company_id)
-                if company_updates:
-                    company_updates = {"lender_id": company_id, **company_updates}
-                    cached_updates = self.data_manager.load_previous_updates()
-                    updated = False
-                    for i, update in enumerate(cached_updates):
-                        if update.get('lender_id') == company_id:
-                            cached_updates[i] = company_updates
-                            updated = True
-                            break
-                    if not updated:
-                        cached_updates.append(company_updates)
-                    self.data_manager.save_updates(cached_updates)
-
-                if not company_updates:
-                    await query.edit_message_text(f"No updates found for {company_name}", disable_web_page_preview=True)
-                    return
-
-                if update_type == "latest":
-                    latest_update = {"lender_id": company_id, "company_name": company_name}
-                    if "items" in company_updates and company_updates["items"]:
-                        latest_year = company_updates["items"][0]
-                        if "items" in latest_year and latest_year["items"]:
-                            latest_item = latest_year["items"][0]
-                            latest_update.update(latest_item)
-                    message = self.format_update_message(latest_update)
-                    await query.edit_message_text(message, parse_mode='HTML', disable_web_page_preview=True)
-
-                else:  # all updates
-                    messages = []
-                    for year_data in sorted(company_updates.get("items", []), key=lambda x: x.get('year', 0), reverse=True):
-                        year_items = sorted(year_data.get("items", []),
-                                             key=lambda x: datetime.strptime(x.get('date', '1900-01-01'), '%Y-%m-%d'),
-                                             reverse=True)
-                        for update_item in year_items:
-                            update_with_company = {
-                                "lender_id": company_id,
-                                "company_name": company_name,
-                                **update_item
-                            }
-                            messages.append(self.format_update_message(update_with_company))
-
-                    updates_per_page = 5
-                    total_updates = len(messages)
-                    total_pages = (total_updates + updates_per_page - 1) // updates_per_page
-
-                    if page >= total_pages:
-                        page = total_pages - 1
-                    if page < 0:
-                        page = 0
-
-                    start_idx = page * updates_per_page
-                    end_idx = min(start_idx + updates_per_page, total_updates)
-
-                    header_message = (
-                        f"📊 Updates for {company_name}\n"
-                        f"Page {page + 1} of {total_pages}\n"
-                        f"Showing updates {start_idx + 1}-{end_idx} of {total_updates}"
-                    )
-                    await self.send_message(query.message.chat_id, header_message, disable_web_page_preview=True)
-
-                    current_page_updates = messages[start_idx:end_idx]
-                    for message in current_page_updates:
-                        await self.send_message(query.message.chat_id, message, disable_web_page_preview=True)
-
-                    nav_buttons = []
-                    if page > 0:
-                        nav_buttons.append(InlineKeyboardButton("◀️ Previous", callback_data=f"all_{company_id}_{page-1}"))
-                    if page < total_pages - 1:
-                        nav_buttons.append(InlineKeyboardButton("Next ▶️", callback_data=f"all_{company_id}_{page+1}"))
-
-                    if nav_buttons:
-                        reply_markup = InlineKeyboardMarkup([nav_buttons])
-                        await self.send_message(
-                            query.message.chat_id,
-                            "Navigate through updates:",
-                            reply_markup=reply_markup,
-                            disable_web_page_preview=True
-                        )
-
         except BadRequest as e:
             if "Message is not modified" in str(e):
                 # This happens when trying to edit a message with identical content
@@ -1189,6 +1359,8 @@ class MintosBot:
 
     _failed_messages: List[Dict[str, Any]] = []
     _admin_rss_items: List[Any] = []  # Store filtered RSS items for admin operations
+    _recent_documents_cache: Optional[Tuple[Tuple[Tuple[int, int], int], List[str]]] = None  # ((cache file (mtime_ns, size), limit), formatted messages)
+    _company_markup: Optional[Tuple[int, InlineKeyboardMarkup]] = None  # (company_names_version, keyboard)
 
     async def retry_failed_messages(self) -> None:
         """Attempt to resend failed messages"""
@@ -1213,29 +1385,34 @@ class MintosBot:
                 logger.error(f"Failed to resend message: {e}")
                 self._failed_messages.append(msg)
 
-    async def send_message(self, chat_id: Union[int, str], text: str, reply_markup: Optional[InlineKeyboardMarkup] = None, disable_web_page_preview: bool = False, parse_mode: Optional[str] = None) -> None:
+    async def send_message(self, chat_id: Union[int, str], text: str, reply_markup: Optional[InlineKeyboardMarkup] = None, disable_web_page_preview: bool = False, parse_mode: Optional[str] = None, send_slot: Optional[asyncio.Semaphore] = None) -> None:
         max_retries = 3
         base_delay = 1.0
-
-        # Calculate delay based on message length
         message_length = len(text)
-        adaptive_delay = min(2.0 + (message_length / 1000), 5.0)  # Max 5 second delay for very long messages
+        # Resolved once per message rather than on every retry
+        chat_limiter = self._chat_send_limiters[str(chat_id)]
+        global_limiter = self._global_send_limiter
+        bot_send = self.application.bot.send_message
+        link_preview_options = NO_LINK_PREVIEW if disable_web_page_preview else None
+        parse_mode = parse_mode or 'HTML'
+        # A broadcast's concurrency slot is only held for the send itself, not while
+        # waiting on this chat's bucket or sleeping through RetryAfter/backoff
+        slot = send_slot or nullcontext()
 
         for attempt in range(max_retries):
             try:
-                await self.application.bot.send_message(
-                    chat_id=chat_id,
-                    text=text,
-                    parse_mode=parse_mode or 'HTML',
-                    reply_markup=reply_markup,
-                    disable_web_page_preview=disable_web_page_preview
-                )
-                logger.debug(f"Message sent successfully to {chat_id} (length: {message_length} chars)")
-
-                # Apply adaptive delay based on message size and previous success
-                delay = adaptive_delay * (0.8 if attempt == 0 else 1.2)
-                logger.debug(f"Waiting {delay:.1f}s before next message")
-                await asyncio.sleep(delay)
+                # Wait for this chat's bucket first so a global token isn't held while queued
+                await chat_limiter.acquire()
+                async with slot:
+                    await global_limiter.acquire()
+                    await bot_send(
+                        chat_id=chat_id,
+                        text=text,
+                        parse_mode=parse_mode,
+                        reply_markup=reply_markup,
+                        link_preview_options=link_preview_options
+                    )
+                logger.debug("Message sent successfully to %s (length: %d chars)", chat_id, message_length)
                 return
 
             except RetryAfter as e:
@@ -1246,13 +1423,13 @@ class MintosBot:
 
             except Forbidden as e:
                 logger.error(f"Bot was blocked by user {chat_id}: {e}")
-                await self.user_manager.remove_user(str(chat_id))
+                self.user_manager.remove_user(str(chat_id))
                 raise
 
             except BadRequest as e:
                 if "chat not found" in str(e).lower():
                     logger.error(f"Chat {chat_id} not found, removing user")
-                    await self.user_manager.remove_user(str(chat_id))
+                    self.user_manager.remove_user(str(chat_id))
                 raise
 
             except TelegramError as e:
@@ -1271,35 +1448,190 @@ class MintosBot:
                 logger.warning(f"Telegram error, retrying in {delay} seconds: {e}")
                 await asyncio.sleep(delay)
 
+    async def _broadcast(self, chat_ids: List[Union[int, str]], text: str, **kwargs: Any) -> int:
+        """Send the same message to several chats concurrently
+
+        Args:
+            chat_ids: Chats to deliver the message to
+            text: Message text
+            **kwargs: Extra arguments passed through to send_message
+
+        Returns:
+            Number of chats the message was delivered to
+        """
+        return (await self._broadcast_many(chat_ids, [text], **kwargs))[0]
+
+    async def _broadcast_many(self, chat_ids: List[Union[int, str]], texts: List[str], **kwargs: Any) -> List[int]:
+        """Send several messages, in order, to each of several chats
+
+        Every chat gets its messages in sequence while chats proceed
+        independently, so one slow or rate-limited chat doesn't hold back the
+        rest. At most MAX_CONCURRENT_SENDS sends are in flight at once; a chat
+        waiting on its rate limit or a RetryAfter doesn't hold a slot. When
+        BROADCAST_SOURCE_CHAT_ID is set, each message is posted there once and
+        copied to the chats, falling back to a direct send if a copy is rejected.
+
+        Args:
+            chat_ids: Chats to deliver the messages to
+            texts: Message texts, in delivery order
+            **kwargs: Extra arguments passed through to send_message
+
+        Returns:
+            Number of chats each message was delivered to
+        """
+        send_slot = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        if len(chat_ids) > 1:
+            source_message_ids = [await self._post_broadcast_source(text, **kwargs) for text in texts]
+        else:
+            source_message_ids = [None] * len(texts)
+        sent_counts = [0] * len(texts)
+
+        async def _bounded_send(chat_id: Union[int, str], text: str, source_message_id: Optional[int]) -> None:
+            if source_message_id is not None:
+                try:
+                    await self._copy_message(chat_id, source_message_id, kwargs.get('reply_markup'), send_slot)
+                    return
+                except BadRequest as e:
+                    # Only a rejected copy is retried as a send; after a timeout the
+                    # copy may already have been delivered
+                    logger.warning(f"Copying broadcast to {chat_id} was rejected, sending directly: {e}")
+                except TimedOut:
+                    raise
+                except NetworkError:
+                    # The copy never reached Telegram; queue it like a failed direct send
+                    self._failed_messages.append({
+                        'chat_id': chat_id,
+                        'text': text,
+                        'reply_markup': kwargs.get('reply_markup'),
+                        'parse_mode': kwargs.get('parse_mode') or 'HTML',
+                        'disable_web_page_preview': kwargs.get('disable_web_page_preview', False)
+                    })
+                    raise
+            await self.send_message(chat_id, text, send_slot=send_slot, **kwargs)
+
+        async def _send_all(chat_id: Union[int, str]) -> None:
+            for i, (text, source_message_id) in enumerate(zip(texts, source_message_ids)):
+                try:
+                    await _bounded_send(chat_id, text, source_message_id)
+                    sent_counts[i] += 1
+                except Forbidden as e:
+                    logger.error(f"Failed to send message to {chat_id}, skipping remaining messages: {e}")
+                    return
+                except Exception as e:
+                    logger.error(f"Failed to send message to {chat_id}: {e}")
+
+        await asyncio.gather(*(_send_all(chat_id) for chat_id in chat_ids))
+
+        failed_count = len(chat_ids) * len(texts) - sum(sent_counts)
+        if failed_count:
+            logger.warning(f"Broadcast to {len(chat_ids)} chats finished with {failed_count} failed sends")
+        return sent_counts
+
+    async def _post_broadcast_source(self, text: str, disable_web_page_preview: bool = False, parse_mode: Optional[str] = None, **kwargs: Any) -> Optional[int]:
+        """Post a broadcast to BROADCAST_SOURCE_CHAT_ID and return its message_id (None if unavailable)"""
+        if not BROADCAST_SOURCE_CHAT_ID:
+            return None
+        try:
+            await self._global_send_limiter.acquire()
+            source = await self.application.bot.send_message(
+                chat_id=BROADCAST_SOURCE_CHAT_ID,
+                text=text,
+                parse_mode=parse_mode or 'HTML',
+                link_preview_options=NO_LINK_PREVIEW if disable_web_page_preview else None
+            )
+            return source.message_id
+        except TelegramError as e:
+            logger.warning(f"Could not post broadcast to source chat {BROADCAST_SOURCE_CHAT_ID}, sending directly: {e}")
+            return None
+
+    async def _copy_message(self, chat_id: Union[int, str], message_id: int, reply_markup: Optional[InlineKeyboardMarkup] = None, send_slot: Optional[asyncio.Semaphore] = None) -> None:
+        """Copy a message from BROADCAST_SOURCE_CHAT_ID, paced and retried like send_message
+
+        Timeouts are not retried: the copy may already have been delivered.
+        """
+        max_retries = 3
+        base_delay = 1.0
+        slot = send_slot or nullcontext()
+        for attempt in range(max_retries):
+            try:
+                await self._chat_send_limiters[str(chat_id)].acquire()
+                async with slot:
+                    await self._global_send_limiter.acquire()
+                    await self.application.bot.copy_message(
+                        chat_id=chat_id,
+                        from_chat_id=BROADCAST_SOURCE_CHAT_ID,
+                        message_id=message_id,
+                        reply_markup=reply_markup
+                    )
+                return
+            except RetryAfter as e:
+                if attempt == max_retries - 1:
+                    raise
+                delay = e.retry_after + 1  # Add 1 second buffer
+                logger.warning(f"Rate limit hit, waiting {delay} seconds before retry")
+                await asyncio.sleep(delay)
+            except Forbidden as e:
+                logger.error(f"Bot was blocked by user {chat_id}: {e}")
+                self.user_manager.remove_user(str(chat_id))
+                raise
+            except TimedOut as e:
+                logger.error(f"Copying broadcast to {chat_id} timed out, not resending: {e}")
+                raise
+            except NetworkError as e:
+                if attempt == max_retries - 1:
+                    logger.error(f"Error copying broadcast to {chat_id}: {e}", exc_info=True)
+                    raise
+                delay = base_delay * (2 ** attempt)  # Exponential backoff
+                logger.warning(f"Network error, retrying copy in {delay} seconds: {e}")
+                await asyncio.sleep(delay)
+
+    def format_update_messages(self, updates: List[Dict[str, Any]]) -> List[str]:
+        """Format a batch of updates; run via asyncio.to_thread for large batches"""
+        return [self.format_update_message(update) for update in updates]
+
     def format_update_message(self, update: Dict[str, Any]) -> str:
         """Format update message with rich information from Mintos API"""
-        logger.debug(f"Formatting update message for: {update.get('company_name')}")
+        fields = tuple(update.get(field, _MISSING) for field in UPDATE_MESSAGE_FIELDS)
+        try:
+            return self._render_update_fields(fields)
+        except TypeError:  # Unhashable field value, render without caching
+            return self._render_update_message(update)
+
+    def _render_update_fields_uncached(self, fields: Tuple[Any, ...]) -> str:
+        """Render an update from the UPDATE_MESSAGE_FIELDS values of format_update_message"""
+        return self._render_update_message({
+            field: value for field, value in zip(UPDATE_MESSAGE_FIELDS, fields) if value is not _MISSING
+        })
+
+    def _render_update_message(self, update: Dict[str, Any]) -> str:
+        """Build the update message text"""
+        logger.debug("Formatting update message for: %s", update.get('company_name'))
         company_name = update.get('company_name', 'Unknown Company')
-        message = f"🏢 <b>{company_name}</b>\n"
+        parts = [f"🏢 <b>{company_name}</b>\n"]
 
         if 'date' in update:
-            message += f"📅 <b>{update['date']}</b>"
+            parts.append(f"📅 <b>{update['date']}</b>")
             if 'year' in update:
-                message += f" | Year: <b>{update['year']}</b>"
-            message += "\n"
+                parts.append(f" | Year: <b>{update['year']}</b>")
+            parts.append("\n")
 
         if 'status' in update:
             status = update['status'].replace('_', ' ').title()
-            message += f"\n📊 <b>Status:</b> {status}"
+            parts.append(f"\n📊 <b>Status:</b> {status}")
             if update.get('substatus'):
                 substatus = update['substatus'].replace('_', ' ').title()
-                message += f"\n└ {substatus}"
-            message += "\n"
+                parts.append(f"\n└ {substatus}")
+            parts.append("\n")
 
         if any(key in update for key in ['recoveredAmount', 'remainingAmount', 'expectedRecoveryTo', 'expectedRecoveryFrom']):
-            message += "\n💰 <b>Recovery Information:</b>\n"
+            parts.append("\n💰 <b>Recovery Information:</b>\n")
 
             if update.get('recoveredAmount'):
                 amount = round(float(update['recoveredAmount']))
-                message += f"└ Recovered: <b>€{amount:,}</b>\n"
+                parts.append(f"└ Recovered: <b>€{amount:,}</b>\n")
             if update.get('remainingAmount'):
                 amount = round(float(update['remainingAmount']))
-                message += f"└ Remaining: <b>€{amount:,}</b>\n"
+                parts.append(f"└ Remaining: <b>€{amount:,}</b>\n")
 
             recovery_info = []
             if update.get('expectedRecoveryFrom') and update.get('expectedRecoveryTo'):
@@ -1311,7 +1643,7 @@ class MintosBot:
                 recovery_info.append(f"Up to {percentage}%")
 
             if recovery_info:
-                message += f"└ Expected Recovery: <b>{recovery_info[0]}</b>\n"
+                parts.append(f"└ Expected Recovery: <b>{recovery_info[0]}</b>\n")
 
         if any(key in update for key in ['expectedRecoveryYearFrom', 'expectedRecoveryYearTo']):
             timeline = ""
@@ -1321,31 +1653,18 @@ class MintosBot:
                 timeline = str(update['expectedRecoveryYearTo'])
 
             if timeline:
-                message += f"📆 Expected Recovery Timeline: {timeline}\n"
+                parts.append(f"📆 Expected Recovery Timeline: {timeline}\n")
 
         if 'description' in update:
-            description = update['description']
             # Clean HTML tags and entities
-            description = (description
-                .replace('\u003C', '<')
-                .replace('\u003E', '>')
-                .replace('&#39;', "'")
-                .replace('&rsquo;', "'")
-                .replace('&euro;', '€')
-                .replace('&nbsp;', ' ')
-                .replace('<br>', '\n')
-                .replace('<br/>', '\n')
-                .replace('<br />', '\n')
-                .replace('<p>', '')
-                .replace('</p>', '\n')
-                .strip())
-            message += f"\n📝 Details:\n{description}\n"
+            description = clean_update_description(update['description'])
+            parts.append(f"\n📝 Details:\n{description}\n")
 
         if 'lender_id' in update:
             # Link directly to campaigns page
-            message += f"\n🔗 <a href='https://www.mintos.com/en/campaigns/'>View on Mintos</a>"
+            parts.append(f"\n{MINTOS_CAMPAIGNS_LINK}")
 
-        return message.strip()
+        return "".join(parts).strip()
 
     async def notifications_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle the /notifications command - manage notification preferences"""
@@ -1410,25 +1729,39 @@ class MintosBot:
         
     def format_campaign_message(self, campaign: Dict[str, Any]) -> str:
         """Format campaign message with rich information from Mintos API"""
-        logger.debug(f"Formatting campaign message for ID: {campaign.get('id')}")
+        fields = tuple(campaign.get(field, _MISSING) for field in CAMPAIGN_MESSAGE_FIELDS)
+        try:
+            return self._render_campaign_fields(fields)
+        except TypeError:  # Unhashable field value, render without caching
+            return self._render_campaign_message(campaign)
+
+    def _render_campaign_fields_uncached(self, fields: Tuple[Any, ...]) -> str:
+        """Render a campaign from the CAMPAIGN_MESSAGE_FIELDS values of format_campaign_message"""
+        return self._render_campaign_message({
+            field: value for field, value in zip(CAMPAIGN_MESSAGE_FIELDS, fields) if value is not _MISSING
+        })
+
+    def _render_campaign_message(self, campaign: Dict[str, Any]) -> str:
+        """Build the campaign message text"""
+        logger.debug("Formatting campaign message for ID: %s", campaign.get('id'))
 
         # Set up the header
-        message = "🎯 <b>Mintos Campaign</b>\n\n"
+        parts = ["🎯 <b>Mintos Campaign</b>\n\n"]
 
         # Name (some campaigns have no name)
         if campaign.get('name'):
-            message += f"<b>{campaign.get('name')}</b>\n\n"
+            parts.append(f"<b>{campaign.get('name')}</b>\n\n")
 
         # Campaign type information
         campaign_type = campaign.get('type')
         if campaign_type == 1:
-            message += "📱 <b>Type:</b> Refer a Friend\n"
+            parts.append("📱 <b>Type:</b> Refer a Friend\n")
         elif campaign_type == 2:
-            message += "💰 <b>Type:</b> Cashback\n"
+            parts.append("💰 <b>Type:</b> Cashback\n")
         elif campaign_type == 4:
-            message += "🌟 <b>Type:</b> Special Promotion\n"
+            parts.append("🌟 <b>Type:</b> Special Promotion\n")
         else:
-            message += f"📊 <b>Type:</b> Campaign (Type {campaign_type})\n"
+            parts.append(f"📊 <b>Type:</b> Campaign (Type {campaign_type})\n")
 
         # Validity period
         valid_from = campaign.get('validFrom')
@@ -1438,10 +1771,10 @@ class MintosBot:
             try:
                 from_date = datetime.fromisoformat(valid_from.replace('Z', '+00:00'))
                 to_date = datetime.fromisoformat(valid_to.replace('Z', '+00:00'))
-                message += f"📅 <b>Valid:</b> {from_date.strftime('%Y-%m-%d')} to {to_date.strftime('%Y-%m-%d')}\n"
+                parts.append(f"📅 <b>Valid:</b> {from_date.strftime('%Y-%m-%d')} to {to_date.strftime('%Y-%m-%d')}\n")
             except ValueError:
                 # Fallback if date parsing fails
-                message += f"📅 <b>Valid:</b> {valid_from} to {valid_to}\n"
+                parts.append(f"📅 <b>Valid:</b> {valid_from} to {valid_to}\n")
 
         # Bonus amount
         if campaign.get('bonusAmount'):
@@ -1454,94 +1787,79 @@ class MintosBot:
                     # If it's a number with thousands separator like "50.000"
                     if '.' in bonus_text and not bonus_text.endswith('0'):
                         # Check if it's likely a thousands separator (should end with 3 digits after period)
-                        parts = bonus_text.split('.')
-                        if len(parts) == 2 and len(parts[1]) == 3:
+                        bonus_parts = bonus_text.split('.')
+                        if len(bonus_parts) == 2 and len(bonus_parts[1]) == 3:
                             # This is likely a thousands separator, replace with empty string
                             bonus_value = float(bonus_text.replace('.', ''))
-                            message += f"🎁 <b>Bonus:</b> €{int(bonus_value)}\n"
+                            parts.append(f"🎁 <b>Bonus:</b> €{int(bonus_value)}\n")
                         else:
                             # Keep as is
-                            message += f"🎁 <b>Bonus:</b> €{bonus_text}\n"
+                            parts.append(f"🎁 <b>Bonus:</b> €{bonus_text}\n")
                     else:
                         # Normal case - try to convert to float
                         bonus_value = float(bonus_text)
                         if bonus_value.is_integer():
-                            message += f"🎁 <b>Bonus:</b> €{int(bonus_value)}\n"
+                            parts.append(f"🎁 <b>Bonus:</b> €{int(bonus_value)}\n")
                         else:
-                            message += f"🎁 <b>Bonus:</b> €{bonus_value:.2f}\n"
+                            parts.append(f"🎁 <b>Bonus:</b> €{bonus_value:.2f}\n")
                 except (ValueError, TypeError):
                     # If conversion fails, use original text
-                    message += f"🎁 <b>Bonus:</b> €{bonus_text}\n"
+                    parts.append(f"🎁 <b>Bonus:</b> €{bonus_text}\n")
             except Exception:
                 # Fallback to original value if any error occurs
-                message += f"🎁 <b>Bonus:</b> €{campaign.get('bonusAmount')}\n"
+                parts.append(f"🎁 <b>Bonus:</b> €{campaign.get('bonusAmount')}\n")
 
         # Required investment
         if campaign.get('requiredPrincipalExposure'):
             try:
                 required_amount = float(campaign.get('requiredPrincipalExposure'))
-                message += f"💸 <b>Required Investment:</b> €{required_amount:,.2f}\n"
+                parts.append(f"💸 <b>Required Investment:</b> €{required_amount:,.2f}\n")
             except (ValueError, TypeError):
-                message += f"💸 <b>Required Investment:</b> {campaign.get('requiredPrincipalExposure')}\n"
+                parts.append(f"💸 <b>Required Investment:</b> {campaign.get('requiredPrincipalExposure')}\n")
 
         # Additional bonus information
         if campaign.get('additionalBonusEnabled'):
-            message += f"✨ <b>Extra Bonus:</b> {campaign.get('bonusCoefficient', '?')}%"
+            parts.append(f"✨ <b>Extra Bonus:</b> {campaign.get('bonusCoefficient', '?')}%")
             if campaign.get('additionalBonusDays'):
-                message += f" (for first {campaign.get('additionalBonusDays')} days)\n"
+                parts.append(f" (for first {campaign.get('additionalBonusDays')} days)\n")
             else:
-                message += "\n"
+                parts.append("\n")
 
         # Description if available
         if campaign.get('shortDescription'):
             # Use regex to completely strip all HTML tags and safely handle entity references
-            import re
             description = campaign.get('shortDescription', '')
 
-            # First, handle escaped characters
-            description = description.replace('\u003C', '<').replace('\u003E', '>')
-
             # Handle common HTML entities
-            description = (description
-                .replace('&#39;', "'")
-                .replace('&rsquo;', "'")
-                .replace('&euro;', '€')
-                .replace('&nbsp;', ' ')
-                .replace('&lt;', '<')
-                .replace('&gt;', '>')
-                .replace('&amp;', '&'))
-
-            # Replace common line-breaking tags with newlines first
-            description = (description
-                .replace('<br>', '\n')
-                .replace('<br/>', '\n')
-                .replace('<br />', '\n')
-                .replace('</p>', '\n')
-                .replace('</div>', '\n')
-                .replace('</li>', '\n'))
-
-            # Special handling for list items to preserve formatting
-            description = description.replace('<li>', '• ')
+            description = CAMPAIGN_ENTITY_RE.sub(_campaign_entity_replacement, description)
+
+            # Replace common line-breaking tags with newlines and list items with bullets
+            description = CAMPAIGN_TAG_RE.sub(_campaign_tag_replacement, description)
 
             # Strip all remaining HTML tags
-            description = re.sub(r'<[^>]*>', '', description)
+            description = HTML_TAG_RE.sub('', description)
 
             # Clean up whitespace
             description = description.strip()
-            description = re.sub(r'\n{3,}', '\n\n', description)  # Replace 3+ newlines with 2
-            description = re.sub(r'\s{2,}', ' ', description)      # Replace multiple spaces with one
-            message += f"\n📝 <b>Description:</b>\n{description}\n"
+            description = MULTI_NEWLINE_RE.sub('\n\n', description)  # Replace 3+ newlines with 2
+            description = MULTI_SPACE_RE.sub(' ', description)      # Replace multiple spaces with one
+            parts.append(f"\n📝 <b>Description:</b>\n{description}\n")
 
         # Terms & Conditions link
         if campaign.get('termsConditionsLink'):
-            message += f"\n📄 <a href='{campaign.get('termsConditionsLink')}'>Terms & Conditions</a>"
+            parts.append(f"\n📄 <a href='{campaign.get('termsConditionsLink')}'>Terms & Conditions</a>")
 
         # Add link to Mintos campaigns page
-        message += "\n\n🔗 <a href='https://www.mintos.com/en/campaigns/'>View on Mintos</a>"
+        parts.append(f"\n\n{MINTOS_CAMPAIGNS_LINK}")
+
+        return "".join(parts).strip()
 
-        return message.strip()
+    async def check_updates(self) -> bool:
+        """Fetch, compare, broadcast and cache company updates
 
-    async def check_updates(self) -> None:
+        Returns:
+            True if the check completed, False if it failed
+        """
         try:
             now = datetime.now()
             logger.info(f"Starting update check at {now.strftime('%Y-%m-%d %H:%M:%S')}...")
@@ -1555,28 +1873,30 @@ class MintosBot:
             except Exception as e:
                 logger.error(f"Error checking cache file age before update: {e}")
 
-            # Load previous updates
-            previous_updates = self.data_manager.load_previous_updates()
+            # Load previous updates (blocking file I/O and HTTP run in worker threads
+            # so polling and other handlers stay responsive during the check)
+            previous_updates = await asyncio.to_thread(self.data_manager.load_previous_updates)
             logger.info(f"Loaded {len(previous_updates)} previous updates")
 
             # Fetch new updates
-            lender_ids = [int(id) for id in self.data_manager.company_names.keys()]
+            lender_ids = self.data_manager.lender_ids
             logger.info(f"Fetching updates for {len(lender_ids)} lender IDs")
-            new_updates = self.mintos_client.fetch_all_updates(lender_ids)
+            new_updates = await asyncio.to_thread(self.mintos_client.fetch_all_updates, lender_ids)
             logger.info(f"Fetched {len(new_updates)} new updates from API")
+            if lender_ids and not new_updates:
+                # Every request failed; keep the cached updates rather than overwriting them with nothing
+                logger.error("No updates fetched from API, keeping the existing cache")
+                return False
 
             # Ensure both lists are of the correct type
             previous_updates = cast(List[CompanyUpdate], previous_updates)
             new_updates = cast(List[CompanyUpdate], new_updates)
 
-            # Compare updates
-            added_updates = self.data_manager.compare_updates(new_updates, previous_updates)
+            # Compare updates (walks every cached item, so keep it off the event loop)
+            added_updates = await asyncio.to_thread(self.data_manager.compare_updates, new_updates, previous_updates)
             logger.info(f"Found {len(added_updates)} new updates after comparison")
 
             if added_updates:
-                users = self.user_manager.get_all_users()
-                logger.info(f"Found {len(added_updates)} new updates to process for {len(users)} users")
-
                 today = time.strftime("%Y-%m-%d")
                 # Get all updates for today (both new and existing)
                 today_updates = [update for update in added_updates if update.get('date') == today]
@@ -1584,30 +1904,33 @@ class MintosBot:
 
                 if today_updates:
                     # Filter for updates that haven't been sent yet
-                    unsent_updates = [
-                        update for update in today_updates 
-                        if not self.data_manager.is_update_sent(update)
-                    ]
+                    unsent_updates = await asyncio.to_thread(
+                        lambda: [update for update in today_updates if not self.data_manager.is_update_sent(update)]
+                    )
                     logger.info(f"Found {len(unsent_updates)} unsent updates for today")
 
                     if unsent_updates:
+                        users = self.user_manager.get_all_users()
                         # Send each individual update to all users
                         logger.info(f"Broadcasting {len(unsent_updates)} unsent updates to {len(users)} users")
-                        for i, update in enumerate(unsent_updates):
-                            message = self.format_update_message(update)
-                            for user_id in users:
-                                # Check if user has recovery updates notifications enabled
-                                if self.user_manager.get_notification_preference(user_id, 'recovery_updates'):
-                                    try:
-                                        await self.send_message(user_id, message, disable_web_page_preview=True)
-                                        logger.info(f"Successfully sent update {i+1}/{len(unsent_updates)} to user {user_id}")
-                                    except Exception as e:
-                                        logger.error(f"Failed to send update to user {user_id}: {e}")
-                                else:
-                                    logger.debug(f"Skipping recovery update for user {user_id} - notifications disabled")
-                            
-                            # Mark as sent after broadcasting to all users
-                            self.data_manager.save_sent_update(update)
+                        # Recipients and message texts don't depend on each other, so resolve
+                        # both once up front instead of per update / per user
+                        recipients = []
+                        for user_id in users:
+                            # Check if user has recovery updates notifications enabled
+                            if self.user_manager.get_notification_preference(user_id, 'recovery_updates'):
+                                recipients.append(user_id)
+                            else:
+                                logger.debug("Skipping recovery update for user %s - notifications disabled", user_id)
+                        messages = await asyncio.to_thread(self.format_update_messages, unsent_updates)
+
+                        # Each user receives the updates in order, independently of other users
+                        sent_counts = await self._broadcast_many(recipients, messages, disable_web_page_preview=True)
+                        for i, sent_count in enumerate(sent_counts, 1):
+                            logger.info(f"Sent update {i}/{len(unsent_updates)} to {sent_count}/{len(recipients)} users")
+
+                        # Mark as sent after broadcasting to all users, in one write of the sent file
+                        await asyncio.to_thread(self.data_manager.save_sent_updates, unsent_updates)
                     else:
                         logger.info("No new unsent updates to send")
                 else:
@@ -1616,7 +1939,9 @@ class MintosBot:
             # Save updates to file
             try:
                 before_size = os.path.getsize(UPDATES_FILE) if os.path.exists(UPDATES_FILE) else 0
-                self.data_manager.save_updates(new_updates)
+                # Company updates staged before this check are older than new_updates
+                self._pending_company_updates.clear()
+                await asyncio.to_thread(self.data_manager.save_updates, new_updates)
                 after_size = os.path.getsize(UPDATES_FILE) if os.path.exists(UPDATES_FILE) else 0
 
                 # Check if the file was actually updated
@@ -1632,14 +1957,11 @@ class MintosBot:
             # Campaign checking is now handled by the separate scheduled_campaign_updates task
 
             logger.info(f"Update check completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}. Found {len(added_updates)} new updates.")
+            return True
 
         except Exception as e:
             logger.error(f"Error during update check: {e}", exc_info=True)
-            for user_id in self.user_manager.get_all_users():
-                try:
-                    await self.send_message(user_id, "⚠️ Error occurred while checking for updates", disable_web_page_preview=True)
-                except Exception as nested_e:
-                    logger.error(f"Failed to send error notification to user {user_id}: {nested_e}")
+            return False
 
 
     async def check_campaigns(self) -> None:
@@ -1652,11 +1974,11 @@ class MintosBot:
             logger.info(f"Campaigns cache age: {campaigns_cache_age/3600:.1f} hours")
 
             # Load previous campaigns
-            previous_campaigns = self.data_manager.load_previous_campaigns()
+            previous_campaigns = await asyncio.to_thread(self.data_manager.load_previous_campaigns)
             logger.info(f"Loaded {len(previous_campaigns)} previous campaigns")
 
             # Fetch new campaigns
-            new_campaigns = self.mintos_client.get_campaigns()
+            new_campaigns = await asyncio.to_thread(self.mintos_client.get_campaigns)
             if not new_campaigns:
                 logger.warning("Failed to fetch campaigns or no campaigns available")
                 return
@@ -1715,7 +2037,7 @@ class MintosBot:
 
             # Save campaigns to file
             try:
-                self.data_manager.save_campaigns(new_campaigns)
+                await asyncio.to_thread(self.data_manager.save_campaigns, new_campaigns)
                 logger.info(f"Successfully saved {len(new_campaigns)} campaigns")
             except Exception as e:
                 logger.error(f"Error saving campaigns: {e}")
@@ -1724,11 +2046,11 @@ class MintosBot:
 
         except Exception as e:
             logger.error(f"Error during campaign check: {e}", exc_info=True)
-            for user_id in self.user_manager.get_all_users():
-                try:
-                    await self.send_message(user_id, "⚠️ Error occurred while checking for campaigns", disable_web_page_preview=True)
-                except Exception as nested_e:
-                    logger.error(f"Failed to send campaign error notification to user {user_id}: {nested_e}")
+            await self._broadcast(
+                self.user_manager.get_all_users(),
+                "⚠️ Error occurred while checking for campaigns",
+                disable_web_page_preview=True
+            )
 
     async def check_documents(self) -> None:
         """Check for document updates from loan originators"""
@@ -1768,7 +2090,7 @@ class MintosBot:
                 logger.info("Skipping notifications during startup")
                 # Mark documents as sent without actually sending
                 for document in added_documents:
-                    self.document_scraper.save_sent_document(document)
+                    await asyncio.to_thread(self.document_scraper.save_sent_document, document)
                 return
             
             # Send to all users
@@ -1776,40 +2098,26 @@ class MintosBot:
             # First, filter only documents that haven't been sent today
             unsent_documents = []
             for document in added_documents:
-                if not self.document_scraper.is_document_sent(document):
+                if not await asyncio.to_thread(self.document_scraper.is_document_sent, document):
                     unsent_documents.append(document)
                 else:
-                    logger.debug(f"Document {document.get('title')} for {document.get('company_name')} already sent today, skipping")
+                    logger.debug("Document %s for %s already sent today, skipping", document.get('title'), document.get('company_name'))
             
             logger.info(f"Found {len(unsent_documents)} unsent documents of {len(added_documents)} total")
             
+            # Users with document notifications enabled
+            recipients = [
+                chat_id for chat_id in users
+                if self.user_manager.get_notification_preference(chat_id, 'documents')
+            ]
+
             # Send each unsent document to all users
             for document in unsent_documents:
                 message = self.format_document_message(document)
-                sent_to_users = 0
-                
-                # Send to all users
-                for chat_id in users:
-                    # Check if user has document notifications enabled
-                    if self.user_manager.get_notification_preference(chat_id, 'documents'):
-                        try:
-                            await self.send_message(chat_id, message, disable_web_page_preview=True)
-                            sent_to_users += 1
-                            logger.info(f"Sent document notification for {document.get('company_name')} to {chat_id}")
-                        except Exception as e:
-                            logger.error(f"Error sending document update to {chat_id}: {e}")
-                            # Add to failed messages for retry
-                            self._failed_messages.append({
-                                'chat_id': chat_id,
-                                'text': message,
-                                'parse_mode': 'HTML',
-                                'disable_web_page_preview': True
-                            })
-                    else:
-                        logger.debug(f"Skipping document for user {chat_id} - notifications disabled")
+                sent_to_users = await self._broadcast(recipients, message, disable_web_page_preview=True)
                 
                 # Mark as sent after trying to send to all users
-                self.document_scraper.save_sent_document(document)
+                await asyncio.to_thread(self.document_scraper.save_sent_document, document)
                 logger.info(f"Document for {document.get('company_name')} sent to {sent_to_users} users and marked as sent")
                 
                 # Update user count
@@ -1823,16 +2131,16 @@ class MintosBot:
                 
         except Exception as e:
             logger.error(f"Error during document check: {e}", exc_info=True)
-            for user_id in self.user_manager.get_all_users():
-                try:
-                    await self.send_message(user_id, "⚠️ Error occurred while checking for documents", disable_web_page_preview=True)
-                except Exception as nested_e:
-                    logger.error(f"Failed to send document error notification to user {user_id}: {nested_e}")
+            await self._broadcast(
+                self.user_manager.get_all_users(),
+                "⚠️ Error occurred while checking for documents",
+                disable_web_page_preview=True
+            )
     
     def format_document_message(self, document: Dict[str, Any]) -> str:
         """Format document message with rich information and consistent styling"""
         company_name = document.get('company_name', 'Unknown Company')
-        document_title = document.get('title', 'Untitled Document')
+        document_title = html.escape(document.get('title', 'Untitled Document'))
         document_type = document.get('type', 'Document')
         document_date = document.get('date', 'Unknown date')
         document_url = document.get('url', '#')
@@ -1862,7 +2170,7 @@ class MintosBot:
         
         # Create a visually appealing, consistently styled message
         message = (
-            f"{emoji} <b>{display_type}</b> from <b>{company_name}</b>\n"
+            f"{emoji} <b>{display_type}</b> from <b>{html.escape(company_name)}</b>\n"
             f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
             f"📄 <b>Title:</b> {document_title}\n"
             f"📅 <b>Date:</b> {document_date}\n\n"
@@ -1945,7 +2253,7 @@ class MintosBot:
                 )
                 return  # Exit and wait for callback
 
-            updates = self.data_manager.load_previous_updates()
+            updates = await asyncio.to_thread(self.data_manager.load_previous_updates)
             if not updates:
                 logger.warning("No updates found in cache")
                 await self.send_message(chat_id, "No cached updates found. Try using the admin refresh option.", disable_web_page_preview=True)
@@ -1956,45 +2264,8 @@ class MintosBot:
             logger.debug(f"Using cached data (age: {cache_age:.0f} seconds)")
 
             logger.debug(f"Searching for updates on date: {target_date}")
-            date_updates = []
-
-            for company_update in updates:
-                if not isinstance(company_update, dict):
-                    logger.warning(f"Invalid update format: {type(company_update)}")
-                    continue
-
-                if "items" not in company_update:
-                    logger.warning(f"No 'items' in company update: {company_update.keys()}")
-                    continue
-
-                lender_id = company_update.get('lender_id')
-                if not lender_id:
-                    logger.warning("Missing lender_id in company update")
-                    continue
-
-                company_name = self.data_manager.get_company_name(lender_id)
-                logger.debug(f"Processing updates for company: {company_name} (ID: {lender_id})")
-
-                for year_data in company_update["items"]:
-                    if not isinstance(year_data, dict):
-                        logger.warning(f"Invalid year_data format: {type(year_data)}")
-                        continue
-
-                    items = year_data.get("items", [])
-                    if not isinstance(items, list):
-                        logger.warning(f"Invalid items format: {type(items)}")
-                        continue
-
-                    for item in items:
-                        if item.get('date') == target_date:
-                            update_with_company = {
-                                "lender_id": lender_id,
-                                "company_name": company_name,
-                                **year_data,
-                                **item
-                            }
-                            date_updates.append(update_with_company)
-                            logger.debug(f"Found update for {company_name} on {target_date}")
+            date_updates = await asyncio.to_thread(self.data_manager.get_updates_for_date, target_date)
+            logger.debug(f"Found {len(date_updates)} updates on {target_date}")
 
             # Check if we have any updates
             have_updates = len(date_updates) > 0
@@ -2039,28 +2310,14 @@ class MintosBot:
             header_message = f"📅 Found {len(date_updates)} updates for {date_desc}:\n"
             await self.send_message(chat_id, header_message, disable_web_page_preview=True)
 
-            # Send each update individually
-            for i, update_item in enumerate(date_updates, 1):
+            # Combine the updates into as few messages as fit Telegram's length limit
+            messages = await asyncio.to_thread(self.format_update_messages, date_updates)
+            for i, chunk in enumerate(join_under_limit(messages), 1):
                 try:
-                    message = self.format_update_message(update_item)
-                    await self.send_message(chat_id, message, disable_web_page_preview=True)
-                    logger.debug(f"Successfully sent update {i}/{len(date_updates)} to {chat_id}")
-                    # The send_message method already has adaptive delays built in
-                except RetryAfter as e:
-                    # If we hit rate limiting, wait the required time plus a buffer
-                    wait_time = e.retry_after + 0.5
-                    logger.warning(f"Rate limited by Telegram. Waiting {wait_time} seconds")
-                    await asyncio.sleep(wait_time)
-                    
-                    # Retry sending after waiting
-                    try:
-                        await self.send_message(chat_id, message, disable_web_page_preview=True)
-                        logger.debug(f"Successfully sent update {i}/{len(date_updates)} after rate limit wait")
-                    except Exception as retry_err:
-                        logger.error(f"Failed to send update {i} after rate limit wait: {retry_err}", exc_info=True)
-                        continue
+                    await self.send_message(chat_id, chunk, disable_web_page_preview=True)
+                    logger.debug(f"Successfully sent updates message {i} to {chat_id}")
                 except Exception as e:
-                    logger.error(f"Error sending update {i}/{len(date_updates)}: {e}", exc_info=True)
+                    logger.error(f"Error sending updates message {i} to {chat_id}: {e}", exc_info=True)
                     continue
 
         except Exception as e:
@@ -2073,28 +2330,23 @@ class MintosBot:
     async def should_check_updates(self) -> bool:
         """Check if updates should be checked based on current time"""
         now = datetime.now()
-        # Enhanced logging of server time
-        logger.debug(f"Current server time: {now.strftime('%Y-%m-%d %H:%M:%S')} (weekday: {now.weekday()}, hour: {now.hour})")
-
-        # Schedule updates for working days (Monday = 0, Sunday = 6)
-        # at specific hours (15:00, 16:00, 1700 UTC)
-        is_scheduled_time = (
-            now.weekday() < 5 and  # Monday to Friday
-            now.hour in [15, 16, 17]  # 3 PM, 4 PM, 5 PM UTC
-        )
+        is_weekday = now.weekday() < 5  # Monday = 0, Sunday = 6
 
-        # By default, check based on schedule
-        should_check = is_scheduled_time
+        # Schedule updates for working days at specific hours (15:00, 16:00, 17:00 UTC)
+        if is_weekday and now.hour in UPDATE_CHECK_HOURS:
+            logger.info(f"Update check scheduled for current time: {now:%Y-%m-%d %H:%M:%S}")
+            return True
 
-        # Add a recovery mechanism for missed updates
+        # Outside the schedule, only check to recover from missed updates
+        should_check = False
         try:
             # Check for stale cache on weekdays
-            if os.path.exists(UPDATES_FILE):
+            if is_weekday and os.path.exists(UPDATES_FILE):
                 cache_age_hours = self.data_manager.get_cache_age() / 3600
                 logger.debug(f"Cache file age: {cache_age_hours:.1f} hours")
 
                 # If cache is more than 24 hours old on a weekday, log a warning and trigger an update
-                if cache_age_hours > 24 and now.weekday() < 5:
+                if cache_age_hours > 24:
                     logger.warning(f"Cache file is {cache_age_hours:.1f} hours old on a weekday - may indicate missed updates")
 
                     # Force an update during business hours even if outside scheduled update times
@@ -2106,9 +2358,7 @@ class MintosBot:
             logger.error(f"Error checking cache file status: {e}")
 
         if not should_check:
-            logger.debug(f"Skipping updatecheck - outside scheduled hours (weekday: {now.weekday()}, hour: {now.hour})")
-        else:
-            logger.info(f"Update check scheduled for current time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+            logger.debug(f"Skipping update check - outside scheduled hours (weekday: {now.weekday()}, hour: {now.hour})")
         return should_check
 
     # Dictionary to track last refresh command usage per user
@@ -2187,38 +2437,27 @@ class MintosBot:
             except Exception as e:
                 logger.warning(f"Could not delete command message: {e}")
                 
-            # Get documents
-            previous_documents = self.document_scraper.load_previous_documents()
+            # Get the 5 most recent documents, already formatted
+            recent_messages = await self._get_recent_document_messages()
             
-            if not previous_documents:
+            if not recent_messages:
                 await self.send_message(
                     chat_id, 
                     "No documents found in cache. Use the refresh button to check for documents.", 
                     disable_web_page_preview=True
                 )
             else:
-                # Sort documents by date (newest first)
-                sorted_documents = sorted(
-                    previous_documents, 
-                    key=lambda x: datetime.strptime(x.get('date', '1900-01-01'), '%Y-%m-%d') if x.get('date') else datetime.min,
-                    reverse=True
-                )
-                
-                # Get the 5 most recent documents
-                recent_documents = sorted_documents[:5]
-                
                 await self.send_message(
                     chat_id,
                     f"📄 <b>Recent Company Documents</b>\n"
                     f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-                    f"Showing the {len(recent_documents)} most recent documents from Mintos loan originators:",
+                    f"Showing the {len(recent_messages)} most recent documents from Mintos loan originators:",
                     disable_web_page_preview=True,
                     parse_mode='HTML'
                 )
                 
                 # Send each document
-                for document in recent_documents:
-                    message = self.format_document_message(document)
+                for message in recent_messages:
                     await self.send_message(chat_id, message, disable_web_page_preview=True, parse_mode='HTML')
             
             # Add refresh button with cancel button
@@ -2249,6 +2488,35 @@ class MintosBot:
                 error_msg = error_msg[:97] + "..."
             await self.send_message(chat_id, f"⚠️ {error_msg}", disable_web_page_preview=True)
     
+    async def _get_recent_document_messages(self, limit: int = 5) -> List[str]:
+        """Get formatted messages for the most recent documents
+
+        The result is cached against the documents cache file's (mtime_ns, size) and
+        the limit, so repeated /documents calls skip the sort and formatting until the
+        file changes.
+        """
+        file_key = self.data_manager._file_key(self.document_scraper.documents_cache_file)
+        if file_key is None:
+            return []
+
+        cache_key = (file_key, limit)
+        if self._recent_documents_cache and self._recent_documents_cache[0] == cache_key:
+            return list(self._recent_documents_cache[1])
+
+        # Parse the cache file in a worker thread so other handlers keep running
+        previous_documents = await asyncio.to_thread(self.document_scraper.load_previous_documents)
+
+        # Sort documents by date (newest first)
+        sorted_documents = sorted(
+            previous_documents, 
+            key=lambda x: datetime.strptime(x.get('date', '1900-01-01'), '%Y-%m-%d') if x.get('date') else datetime.min,
+            reverse=True
+        )
+        messages = [self.format_document_message(document) for document in sorted_documents[:limit]]
+
+        self._recent_documents_cache = (cache_key, messages)
+        return list(messages)
+
     async def campaigns_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /campaigns command to show active Mintos campaigns"""
         if not update.effective_chat:
@@ -2269,18 +2537,18 @@ class MintosBot:
             await self.send_message(chat_id, "🔄 Fetching latest campaigns...", disable_web_page_preview=True)
 
             # Load previous campaigns for comparison
-            previous_campaigns = self.data_manager.load_previous_campaigns()
+            previous_campaigns = await asyncio.to_thread(self.data_manager.load_previous_campaigns)
             logger.info(f"Loaded {len(previous_campaigns)} previous campaigns for comparison")
 
             try:
                 # Fetch new campaigns directly from Mintos
-                new_campaigns = self.mintos_client.get_campaigns()
+                new_campaigns = await asyncio.to_thread(self.mintos_client.get_campaigns)
                 if not new_campaigns:
                     await self.send_message(chat_id, "⚠️ No campaigns available right now.", disable_web_page_preview=True)
                     return
 
                 # Save for future use
-                self.data_manager.save_campaigns(new_campaigns)
+                await asyncio.to_thread(self.data_manager.save_campaigns, new_campaigns)
                 logger.info(f"Fetched and saved {len(new_campaigns)} campaigns")
                 
                 # Find new or updated campaigns
@@ -2309,24 +2577,18 @@ class MintosBot:
                         )
                         
                         # Send to all users
-                        for i, campaign in enumerate(unsent_campaigns, 1):
-                            message = self.format_campaign_message(campaign)
-                            for user_id in users:
-                                try:
-                                    await self.send_message(user_id, message, disable_web_page_preview=True)
-                                    # Mark as sent to prevent duplicate notifications
-                                    self.data_manager.save_sent_campaign(campaign)
-                                    logger.info(f"Successfully sent campaign {i}/{len(unsent_campaigns)} to user {user_id}")
-                                except Exception as e:
-                                    logger.error(f"Failed to send campaign to user {user_id}: {e}")
-                                    
-                            # Add a delay between campaigns
-                            await asyncio.sleep(1)
+                        messages = [self.format_campaign_message(campaign) for campaign in unsent_campaigns]
+                        sent_counts = await self._broadcast_many(users, messages, disable_web_page_preview=True)
+                        for i, (campaign, sent_count) in enumerate(zip(unsent_campaigns, sent_counts), 1):
+                            logger.info(f"Sent campaign {i}/{len(unsent_campaigns)} to {sent_count}/{len(users)} users")
+                            if sent_count:
+                                # Mark as sent to prevent duplicate notifications
+                                self.data_manager.save_sent_campaign(campaign)
                     
             except Exception as e:
                 logger.error(f"Error fetching campaigns: {e}")
                 # If fetching fails, try to use cached data as fallback
-                new_campaigns = self.data_manager.load_previous_campaigns()
+                new_campaigns = await asyncio.to_thread(self.data_manager.load_previous_campaigns)
                 if not new_campaigns:
                     await self.send_message(chat_id, "⚠️ Error fetching campaigns and no cache available. Please try again later.", disable_web_page_preview=True)
                     return
@@ -2360,13 +2622,12 @@ class MintosBot:
                 disable_web_page_preview=True
             )
 
-            # Send each campaign with a small delay between messages
+            # Send each campaign; send_message's per-chat limiter spaces them out
             for i, campaign in enumerate(sorted_campaigns, 1):
                 try:
                     message = self.format_campaign_message(campaign)
                     await self.send_message(chat_id, message, disable_web_page_preview=True)
                     logger.debug(f"Successfully sent campaign {i}/{len(sorted_campaigns)} to {chat_id}")
-                    await asyncio.sleep(1)  # Small delay between messages
                 except Exception as e:
                     logger.error(f"Error sending campaign {i}/{len(sorted_campaigns)}: {e}", exc_info=True)
                     continue
@@ -2399,30 +2660,12 @@ class MintosBot:
             # If we can't parse dates, consider the campaign active by default
             return True
 
-    async def trigger_today_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Trigger an update check for today's updates or for a specified date"""
-        if not update.effective_chat:
-            return
-
-        chat_id = update.effective_chat.id
-        try:
-            # Check if a date was specified
-            date_text = "today's"
-            if context and hasattr(context, 'args') and context.args:
-                date_text = f"updates for {context.args[0]}"
-            
-            await self.send_message(chat_id, f"🔄 Checking {date_text}...", disable_web_page_preview=True)
-            await self.today_command(update, context)
-        except Exception as e:
-            logger.error(f"Error in trigger_today command: {e}")
-            await self.send_message(chat_id, "⚠️ Error checking updates", disable_web_page_preview=True)
-
     async def _resolve_channel_id(self, channel_identifier: str) -> str:
         """Validate channel/user ID format and verify permissions"""
         logger.info(f"Validating target ID: {channel_identifier}")
 
         # Check if it's a registered user ID first
-        if channel_identifier in self.user_manager.get_all_users():
+        if self.user_manager.has_user(channel_identifier):
             logger.info(f"Valid registered user ID: {channel_identifier}")
             return channel_identifier
             
@@ -2694,25 +2937,7 @@ class MintosBot:
 
             # Retrieve updates for the target date
             logger.info(f"Getting updates for {date_desc}")
-            updates = self.data_manager.load_previous_updates()
-            date_updates = []
-
-            # Process updates
-            for company_update in updates:
-                if "items" in company_update:
-                    lender_id = company_update.get('lender_id')
-                    company_name = self.data_manager.get_company_name(lender_id)
-
-                    for year_data in company_update["items"]:
-                        for item in year_data.get("items", []):
-                            if item.get('date') == date_to_check:
-                                update_with_company = {
-                                    "lender_id": lender_id,
-                                    "company_name": company_name,
-                                    **year_data,
-                                    **item
-                                }
-                                date_updates.append(update_with_company)
+            date_updates = await asyncio.to_thread(self.data_manager.get_updates_for_date, date_to_check)
 
             logger.info(f"Found {len(date_updates)} updates for {date_desc}")
 
@@ -2802,10 +3027,7 @@ class MintosBot:
         user_id = update.effective_user.id
         
         # Check if this is a date input (YYYY-MM-DD format)
-        import re
-        date_pattern = r'^\d{4}-\d{2}-\d{2}$'
-        
-        if re.match(date_pattern, text):
+        if DATE_INPUT_RE.match(text):
             # Check if user is admin (only admins can use custom dates)
             if not await self.is_admin(user_id):
                 await update.message.reply_text("⚠️ Only admin can use custom date selection.")
@@ -2813,7 +3035,6 @@ class MintosBot:
                 
             # Validate the date
             try:
-                from datetime import datetime
                 datetime.strptime(text, '%Y-%m-%d')
                 
                 # Get all registered users for the admin trigger
@@ -2904,12 +3125,9 @@ class MintosBot:
             logger.info(f"Found {len(new_items)} new RSS items")
 
             # Group items by feed source and send to appropriate users
-            items_by_feed = {}
+            items_by_feed = defaultdict(list)
             for item in new_items:
-                feed_source = item.feed_source
-                if feed_source not in items_by_feed:
-                    items_by_feed[feed_source] = []
-                items_by_feed[feed_source].append(item)
+                items_by_feed[item.feed_source].append(item)
 
             # Send notifications for each feed
             for feed_source, items in items_by_feed.items():
@@ -2925,23 +3143,10 @@ class MintosBot:
                 # Send each item to subscribed users
                 for item in items:
                     message = self.rss_reader.format_rss_message(item)
-                    
-                    for chat_id in feed_users:
-                        try:
-                            await self.send_message(
-                                chat_id,
-                                message,
-                                parse_mode='HTML',
-                                disable_web_page_preview=True
-                            )
-                            await asyncio.sleep(0.1)  # Rate limiting
-                        except Exception as e:
-                            logger.error(f"Error sending {feed_source} RSS notification to {chat_id}: {e}")
-                            if "bot was blocked" in str(e).lower():
-                                self.user_manager.remove_user(chat_id)
+                    await self._broadcast(feed_users, message, parse_mode='HTML', disable_web_page_preview=True)
 
                     # Mark item as sent after sending to all subscribed users
-                    self.rss_reader.mark_item_as_sent(item)
+                    await asyncio.to_thread(self.rss_reader.mark_item_as_sent, item)
 
         except Exception as e:
             logger.error(f"Error checking RSS updates: {e}", exc_info=True)
@@ -2962,6 +3167,7 @@ class MintosBot:
 
     async def scheduled_rss_updates(self) -> None:
         """Handle RSS checks every 15 minutes during specified hours"""
+        deadline = time.monotonic()
         while True:
             try:
                 if await self.should_check_rss():
@@ -2971,33 +3177,37 @@ class MintosBot:
                 else:
                     logger.debug(f"Skipping RSS check - outside scheduled hours (weekday: {datetime.now().weekday()}, hour: {datetime.now().hour})")
                 
-                # Wait 15 minutes before next check
-                await asyncio.sleep(15 * 60)
+                # Wait for the next 15-minute tick, measured from the previous one rather than from now
+                deadline = await sleep_until_next_tick(deadline, RSS_CHECK_INTERVAL)
                 
             except Exception as e:
                 logger.error(f"RSS check failed: {e}", exc_info=True)
                 # Wait 5 minutes on error before retrying
                 await asyncio.sleep(5 * 60)
+                deadline = time.monotonic()
 
     async def scheduled_campaign_updates(self) -> None:
         """Handle campaign checks every 10 minutes on weekdays between 6 AM and 8 PM with 4-hour delay for non-admin users"""
+        deadline = time.monotonic()
         while True:
             try:
-                await asyncio.sleep(10 * 60)  # Check every 10 minutes
+                # Check every 10 minutes, measured from the previous tick rather than from now
+                deadline = await sleep_until_next_tick(deadline, CAMPAIGN_CHECK_INTERVAL)
                 
-                # Check if we should run the campaign check (weekdays only, 6 AM to 8 PM)
+                # Campaigns are only checked on weekdays, 6 AM to 8 PM; outside that window
+                # sleep straight through to its next opening instead of waking every tick
                 now = datetime.now()
-                weekday = now.weekday()  # 0=Monday, 6=Sunday
-                hour = now.hour
+                if not (now.weekday() < 5 and 6 <= now.hour < 20):
+                    window_start = self._next_campaign_window_start(now)
+                    logger.debug("Outside campaign hours, next campaign check at %s", window_start)
+                    await asyncio.sleep(max((window_start - datetime.now()).total_seconds(), 0))
+                    deadline = time.monotonic()
+
+                logger.info("Running scheduled campaign check")
+                await self.check_campaigns()
                 
-                if weekday < 5 and 6 <= hour < 20:  # Monday-Friday, 6 AM to 8 PM
-                    logger.info("Running scheduled campaign check")
-                    await self.check_campaigns()
-                    
-                    # Also check for ready pending campaigns
-                    await self.process_pending_campaigns()
-                else:
-                    logger.debug(f"Skipping campaign check - outside scheduled hours (weekday: {weekday}, hour: {hour})")
+                # Also check for ready pending campaigns
+                await self.process_pending_campaigns()
                 
             except asyncio.CancelledError:
                 logger.info("Scheduled campaign updates cancelled")
@@ -3006,6 +3216,18 @@ class MintosBot:
                 logger.error(f"Campaign check failed: {e}", exc_info=True)
                 # Wait 2 minutes on error before retrying
                 await asyncio.sleep(2 * 60)
+                deadline = time.monotonic()
+
+    def _next_campaign_window_start(self, now: datetime) -> datetime:
+        """Get the next weekday 6 AM strictly after now"""
+        for days_ahead in range(8):
+            day = now + timedelta(days=days_ahead)
+            if day.weekday() >= 5:  # Saturday or Sunday
+                continue
+            window_start = day.replace(hour=6, minute=0, second=0, microsecond=0)
+            if window_start > now:
+                return window_start
+        raise RuntimeError("No campaign window within a week")
 
     async def process_pending_campaigns(self) -> None:
         """Process campaigns that are ready to be sent after the delay"""
@@ -3021,6 +3243,11 @@ class MintosBot:
             all_users = self.user_manager.get_all_users()
             admin_id = 114691530  # Hardcoded admin ID
             non_admin_users = [user_id for user_id in all_users if user_id != admin_id]
+            # The same recipients for every campaign: non-admin users with campaign notifications enabled
+            recipients = [
+                user_id for user_id in non_admin_users
+                if self.user_manager.get_notification_preference(user_id, 'campaigns')
+            ]
             
             for pending_item in ready_campaigns:
                 campaign = pending_item['campaign']
@@ -3038,19 +3265,10 @@ class MintosBot:
                     self.data_manager.remove_pending_campaign(campaign_id)
                     continue
                     
-                # Send to non-admin users
+                # Send to non-admin users with campaign notifications enabled
                 message = self.format_campaign_message(campaign)
-                
-                for user_id in non_admin_users:
-                    # Check if user has campaign notifications enabled
-                    if self.user_manager.get_notification_preference(user_id, 'campaigns'):
-                        try:
-                            await self.send_message(user_id, message, disable_web_page_preview=True)
-                            logger.info(f"Sent delayed campaign {campaign_id} to user {user_id}")
-                        except Exception as e:
-                            logger.error(f"Failed to send delayed campaign to user {user_id}: {e}")
-                    else:
-                        logger.debug(f"Skipping campaign for user {user_id} - notifications disabled")
+                sent_count = await self._broadcast(recipients, message, disable_web_page_preview=True)
+                logger.info(f"Sent delayed campaign {campaign_id} to {sent_count}/{len(recipients)} users")
                 
                 # Remove from pending list and mark as sent
                 self.data_manager.remove_pending_campaign(campaign_id)
@@ -3138,16 +3356,7 @@ class MintosBot:
             logger.warning(f"Could not delete command message: {e}")
         
         # Create admin panel with inline keyboard
-        keyboard = [
-            [InlineKeyboardButton("👥 View Users", callback_data="admin_users")],
-            [InlineKeyboardButton("🔄 Refresh Updates", callback_data="admin_refresh_updates")],
-            [InlineKeyboardButton("📄 Refresh Documents", callback_data="admin_refresh_documents")],
-            [InlineKeyboardButton("📤 Send Updates", callback_data="admin_trigger_today")],
-            [InlineKeyboardButton("📰 Send RSS Items", callback_data="admin_send_rss")],
-            [InlineKeyboardButton("❌ Exit", callback_data="admin_exit")]
-        ]
-        
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        reply_markup = ADMIN_PANEL_MARKUP
         await self.send_message(
             chat_id,
             "🔐 <b>Admin Control Panel</b>\n\n"
@@ -3189,13 +3398,12 @@ class MintosBot:
             self._admin_rss_items = filtered_items
             
             # Count filtered items by feed source
-            feed_counts = {}
-            for item in filtered_items:
-                feed_source = item.feed_source
-                feed_counts[feed_source] = feed_counts.get(feed_source, 0) + 1
+            feed_counts = Counter(item.feed_source for item in filtered_items)
             
-            message_text = "📰 <b>Select RSS Feed</b>\n\n"
-            message_text += "Choose which RSS feed to browse:\n\n"
+            message_text = (
+                "📰 <b>Select RSS Feed</b>\n\n"
+                "Choose which RSS feed to browse:\n\n"
+            )
             
             keyboard = []
             
@@ -3265,8 +3473,10 @@ class MintosBot:
             }
             feed_name = feed_names.get(feed_source, feed_source.title())
             
-            message_text = f"📰 <b>{feed_name} - Select Items</b>\n\n"
-            message_text += f"Found {total_items} items. Select items to send:\n\n"
+            message_text = (
+                f"📰 <b>{feed_name} - Select Items</b>\n\n"
+                f"Found {total_items} items. Select items to send:\n\n"
+            )
             
             keyboard = []
             
@@ -3319,11 +3529,13 @@ class MintosBot:
             selected_item = rss_items[item_index]
             
             # Show the selected item and ask where to send it
-            message_text = f"📰 <b>Selected RSS Item</b>\n\n"
-            message_text += f"<b>Title:</b> {html.escape(selected_item.title)}\n"
-            message_text += f"<b>Issuer:</b> {html.escape(selected_item.issuer)}\n"
-            message_text += f"<b>Date:</b> {selected_item.pub_date}\n\n"
-            message_text += "Where would you like to send this item?\n"
+            message_text = (
+                "📰 <b>Selected RSS Item</b>\n\n"
+                f"<b>Title:</b> {html.escape(selected_item.title)}\n"
+                f"<b>Issuer:</b> {html.escape(selected_item.issuer)}\n"
+                f"<b>Date:</b> {selected_item.pub_date}\n\n"
+                "Where would you like to send this item?\n"
+            )
             
             # Get list of users for sending options
             users = self.user_manager.get_all_users()
@@ -3419,25 +3631,10 @@ class MintosBot:
             users = self.user_manager.get_all_users()
             message = self.rss_reader.format_rss_message(selected_item)
             
-            successful_sends = 0
-            for user_id in users:
-                try:
-                    await self.send_message(
-                        chat_id=user_id,
-                        text=message,
-                        parse_mode='HTML',
-                        disable_web_page_preview=True
-                    )
-                    successful_sends += 1
-                    await asyncio.sleep(0.1)  # Rate limiting
-                except Exception as e:
-                    logger.error(f"Error sending RSS to user {user_id}: {e}")
-                    if "bot was blocked" in str(e).lower():
-                        self.user_manager.remove_user(user_id)
+            successful_sends = await self._broadcast(users, message, parse_mode='HTML', disable_web_page_preview=True)
             
             # Add back button
-            keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            reply_markup = ADMIN_BACK_MARKUP
             
             await query.edit_message_text(
                 f"✅ <b>RSS Item Sent Successfully</b>\n\n"
@@ -3486,8 +3683,7 @@ class MintosBot:
                 )
                 
                 # Add back button
-                keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
+                reply_markup = ADMIN_BACK_MARKUP
                 
                 await query.edit_message_text(
                     f"✅ <b>RSS Item Sent Successfully</b>\n\n"
@@ -3543,8 +3739,7 @@ class MintosBot:
                 )
                 
                 # Add back button
-                keyboard = [[InlineKeyboardButton("« Back to Admin Panel", callback_data="admin_back")]]
-                reply_markup = InlineKeyboardMarkup(keyboard)
+                reply_markup = ADMIN_BACK_MARKUP
                 
                 await query.edit_message_text(
                     f"✅ <b>RSS Item Sent Successfully</b>\n\n"
@@ -3607,4 +3802,4 @@ class MintosBot:
 
 if __name__ == "__main__":
     bot = MintosBot()
-    asyncio.run(bot.run())
\ No newline at end of file
+    run_event_loop(bot.run())
\ No newline at end of file
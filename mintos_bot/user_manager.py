@@ -1,10 +1,46 @@
+import atexit
 import json
 import os
+import tempfile
+import threading
+import weakref
 from .logger import setup_logger
-from .config import USERS_FILE, DATA_DIR
+from .config import USERS_FILE, USERS_SAVE_DELAY, DATA_DIR
+
+try:
+    import orjson  # Optional: faster JSON for the user and preference files
+except ImportError:
+    orjson = None
 
 logger = setup_logger(__name__)
 
+# Live managers, flushed once at exit; weak so short-lived instances aren't kept around
+_instances = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_users():
+    """Write scheduled user changes of every live UserManager before exit"""
+    for manager in list(_instances):
+        manager.flush_users()
+
+
+def _read_json(path):
+    """Parse a JSON file, with orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _dump_json(data, indent=False):
+    """Serialize data to UTF-8 JSON bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
 class UserManager:
     def __init__(self):
         self.users = {}  # Changed from set to dict to store username with chat_id
@@ -12,6 +48,10 @@ class UserManager:
         self.notification_preferences_file = os.path.join(DATA_DIR, 'notification_preferences.json')
         self.rss_preferences = {}  # Store RSS notification preferences
         self.notification_preferences = {}  # Store other notification preferences
+        # add_user/remove_user only mark the list dirty; a short timer writes it once per burst
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+        _instances.add(self)
         self._ensure_data_directory()
         self.load_users()
         self._load_rss_preferences()
@@ -26,44 +66,63 @@ class UserManager:
 
     def load_users(self):
         try:
-            if os.path.exists(USERS_FILE):
-                with open(USERS_FILE, 'r') as f:
-                    data = json.load(f)
-                    # Handle both old format (list of chat_ids) and new format (dict with usernames)
-                    if isinstance(data, list):
-                        # Convert old format to new format
-                        self.users = {chat_id: None for chat_id in data}
-                        logger.info(f"Converted {len(data)} users from old format to new format")
-                    else:
-                        self.users = data
-                logger.info(f"Loaded {len(self.users)} users")
+            data = _read_json(USERS_FILE)
+            # Handle both old format (list of chat_ids) and new format (dict with usernames)
+            if isinstance(data, list):
+                # Convert old format to new format; ids are stored as str like add_user does
+                self.users = {str(chat_id): None for chat_id in data}
+                logger.info(f"Converted {len(data)} users from old format to new format")
             else:
-                self.users = {}
+                self.users = data
+            logger.info(f"Loaded {len(self.users)} users")
+        except FileNotFoundError:
+            self.users = {}
         except Exception as e:
             logger.error(f"Error loading users: {e}")
             self.users = {}  # Reset to empty dict on error
 
     def save_users(self):
         try:
-            with open(USERS_FILE, 'w') as f:
-                json.dump(self.users, f)
-            logger.info(f"Users saved successfully: {self.users}")
-            
-            # Verify the file was written correctly
-            if os.path.exists(USERS_FILE):
-                with open(USERS_FILE, 'r') as f:
-                    saved_data = f.read().strip()
-                    logger.info(f"Verification - users.json contains: {saved_data}")
-            else:
-                logger.error(f"Verification failed - {USERS_FILE} does not exist after save")
+            # Snapshot first so a concurrent add/remove can't change the dict mid-dump
+            users = dict(self.users)
+            # Write to a temp file and swap it in, so a crash never leaves a truncated users.json
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(USERS_FILE) or '.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_dump_json(users, indent=True))
+                os.replace(tmp_path, USERS_FILE)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            logger.info(f"Users saved successfully: {len(users)} users")
         except Exception as e:
             logger.error(f"Error saving users: {e}", exc_info=True)
 
+    def _schedule_save(self):
+        """Save the users after USERS_SAVE_DELAY, folding in any other changes made meanwhile"""
+        with self._save_lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(USERS_SAVE_DELAY, self.flush_users)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush_users(self):
+        """Write any scheduled user changes now"""
+        with self._save_lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is None:
+            return
+        timer.cancel()  # No-op when called from the timer itself
+        self.save_users()
+
     def add_user(self, chat_id, username=None):
         """Add or update a user with optional username"""
         chat_id = str(chat_id)
+        if chat_id in self.users and self.users[chat_id] == username:
+            logger.info(f"User {chat_id} already registered, skipping save")
+            return
         self.users[chat_id] = username
-        self.save_users()
+        self._schedule_save()
         if username:
             logger.info(f"Added/updated user: {chat_id} (username: {username})")
         else:
@@ -74,7 +133,7 @@ class UserManager:
         chat_id = str(chat_id)
         if chat_id in self.users:
             username = self.users.pop(chat_id)
-            self.save_users()
+            self._schedule_save()
             if username:
                 logger.info(f"Removed user: {chat_id} (username: {username})")
             else:
@@ -96,12 +155,10 @@ class UserManager:
     def _load_rss_preferences(self):
         """Load RSS notification preferences"""
         try:
-            if os.path.exists(self.rss_preferences_file):
-                with open(self.rss_preferences_file, 'r') as f:
-                    self.rss_preferences = json.load(f)
-                logger.info(f"Loaded RSS preferences for {len(self.rss_preferences)} users")
-            else:
-                self.rss_preferences = {}
+            self.rss_preferences = _read_json(self.rss_preferences_file)
+            logger.info(f"Loaded RSS preferences for {len(self.rss_preferences)} users")
+        except FileNotFoundError:
+            self.rss_preferences = {}
         except Exception as e:
             logger.error(f"Error loading RSS preferences: {e}")
             self.rss_preferences = {}
@@ -109,8 +166,8 @@ class UserManager:
     def _save_rss_preferences(self):
         """Save RSS notification preferences"""
         try:
-            with open(self.rss_preferences_file, 'w') as f:
-                json.dump(self.rss_preferences, f, indent=2)
+            with open(self.rss_preferences_file, 'wb') as f:
+                f.write(_dump_json(self.rss_preferences, indent=True))
             logger.info(f"Saved RSS preferences for {len(self.rss_preferences)} users")
         except Exception as e:
             logger.error(f"Error saving RSS preferences: {e}")
@@ -207,12 +264,10 @@ class UserManager:
     def _load_notification_preferences(self):
         """Load notification preferences from file"""
         try:
-            if os.path.exists(self.notification_preferences_file):
-                with open(self.notification_preferences_file, 'r') as f:
-                    self.notification_preferences = json.load(f)
-                logger.info(f"Loaded notification preferences for {len(self.notification_preferences)} users")
-            else:
-                self.notification_preferences = {}
+            self.notification_preferences = _read_json(self.notification_preferences_file)
+            logger.info(f"Loaded notification preferences for {len(self.notification_preferences)} users")
+        except FileNotFoundError:
+            self.notification_preferences = {}
         except Exception as e:
             logger.error(f"Error loading notification preferences: {e}")
             self.notification_preferences = {}
@@ -221,8 +276,8 @@ class UserManager:
         """Save notification preferences to file"""
         try:
             os.makedirs(os.path.dirname(self.notification_preferences_file), exist_ok=True)
-            with open(self.notification_preferences_file, 'w') as f:
-                json.dump(self.notification_preferences, f, indent=2)
+            with open(self.notification_preferences_file, 'wb') as f:
+                f.write(_dump_json(self.notification_preferences, indent=True))
             logger.info(f"Saved notification preferences for {len(self.notification_preferences)} users")
         except Exception as e:
             logger.error(f"Error saving notification preferences: {e}")
@@ -260,8 +315,8 @@ class UserManager:
                 enabled_users.append(chat_id)
         
         # Also include users not in the file (they get defaults)
-        for chat_id in self.users.keys():
-            if str(chat_id) not in self.notification_preferences:
-                enabled_users.append(str(chat_id))
+        for chat_id in self.users:  # Keys are already str
+            if chat_id not in self.notification_preferences:
+                enabled_users.append(chat_id)
         
-        return list(set(enabled_users))  # Remove duplicates
\ No newline at end of file
+        return enabled_users  # No duplicates: the second loop skips ids that have preferences
\ No newline at end of file
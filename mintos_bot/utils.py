@@ -2,15 +2,28 @@
 Utility functions for the Mintos Telegram Bot
 Provides common helper functions and safe operations.
 """
+import asyncio
 import hashlib
 import json
 import logging
 import os
 import shutil
-from typing import Any, Optional, Union
+import time
+from itertools import islice
+from typing import Any, Coroutine, Iterable, Iterator, Optional, Tuple, Union
 from bs4 import BeautifulSoup, Tag
 from bs4.element import NavigableString
 
+try:
+    import orjson  # Optional: faster JSON parsing and writing for the cache files
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # Optional: libuv-based event loop, not available on Windows
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 def create_unique_id(*args) -> str:
@@ -18,6 +31,58 @@ def create_unique_id(*args) -> str:
     hash_content = "_".join(str(arg) for arg in args)
     return hashlib.md5(hash_content.encode()).hexdigest()
 
+try:
+    from itertools import batched
+except ImportError:  # Python < 3.12
+    def batched(iterable: Iterable[Any], n: int) -> Iterator[Tuple[Any, ...]]:
+        """Yield successive n-sized tuples from iterable (last one may be shorter)"""
+        iterator = iter(iterable)
+        while batch := tuple(islice(iterator, n)):
+            yield batch
+
+class AsyncRateLimiter:
+    """Token bucket allowing at most `rate` acquisitions per `period` seconds"""
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+async def sleep_until_next_tick(deadline: float, interval: float) -> float:
+    """Sleep until `deadline + interval` (time.monotonic()) and return that new deadline
+
+    Keeps a periodic loop phase-locked instead of drifting by the duration of
+    each run. Ticks missed by an overrunning run are skipped, not run back to back.
+    """
+    deadline += interval
+    now = time.monotonic()
+    if deadline < now:
+        missed = int((now - deadline) // interval) + 1
+        logger.warning(f"Periodic task overran its interval, skipping {missed} tick(s)")
+        deadline += missed * interval
+    await asyncio.sleep(deadline - now)
+    return deadline
+
+def run_event_loop(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion like asyncio.run, on uvloop when it is installed"""
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
+
 def safe_get_text(element: Optional[Union[Tag, NavigableString]], default: str = "") -> str:
     """Safely extract text from BeautifulSoup element"""
     if element is None:
@@ -62,15 +127,19 @@ class FileBackupManager:
     def safe_json_load(file_path: str, default: Any = None) -> Any:
         """Safely load JSON file with backup fallback"""
         try:
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    return json.load(f)
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    return orjson.loads(f.read())
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return default
         except Exception as e:
             logger.warning(f"Failed to load {file_path}, trying backup: {e}")
             backup_path = f"{file_path}.bak"
             try:
                 if os.path.exists(backup_path):
-                    with open(backup_path, 'r') as f:
+                    with open(backup_path, 'r', encoding='utf-8') as f:
                         data = json.load(f)
                     logger.info(f"Successfully restored from backup: {backup_path}")
                     return data
@@ -88,9 +157,13 @@ class FileBackupManager:
                 backup_path = f"{file_path}.bak"
                 shutil.copy2(file_path, backup_path)
             
-            # Save the data
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=4)
+            # Save the data (orjson writes UTF-8 rather than ASCII escapes, hence the utf-8 reads above)
+            if orjson is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(file_path, 'w') as f:
+                    json.dump(data, f, indent=4)
             
             logger.debug(f"Successfully saved data to {file_path}")
             return True
@@ -122,4 +195,20 @@ def truncate_text(text: str, max_length: int = 100) -> str:
     """Truncate text to specified length"""
     if len(text) <= max_length:
         return text
-    return text[:max_length-3] + "..."
\ No newline at end of file
+    return text[:max_length-3] + "..."
+
+def join_under_limit(messages: Iterable[str], limit: int = 4000,
+                     separator: str = "\n\n━━━━━━━━━━━━━━\n\n") -> Iterator[str]:
+    """Join consecutive messages into chunks no longer than limit
+
+    Lets several short messages go out as one Telegram message (max 4096 chars).
+    A single message longer than limit is yielded on its own.
+    """
+    chunk = ""
+    for message in messages:
+        if chunk and len(chunk) + len(separator) + len(message) > limit:
+            yield chunk
+            chunk = ""
+        chunk = f"{chunk}{separator}{message}" if chunk else message
+    if chunk:
+        yield chunk
@@ -18,6 +18,7 @@ from mintos_bot.constants import (
     LOCK_FILE, STREAMLIT_PORT, STARTUP_TIMEOUT, CLEANUP_WAIT,
     PROCESS_KILL_WAIT, BOT_STARTUP_TIMEOUT, TELEGRAM_BOT_TOKEN_VAR
 )
+from mintos_bot.utils import run_event_loop
 
 @dataclass
 class ProcessManager:
@@ -280,4 +281,4 @@ def signal_handler(sig, frame):
 if __name__ == "__main__":
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
-    asyncio.run(main())
\ No newline at end of file
+    run_event_loop(main())
\ No newline at end of file
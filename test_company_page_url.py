@@ -24,7 +24,10 @@ async def test_company_page_url():
     company_url = "https://www.mintos.com/en/lending-companies/Capitalia"
     
     print(f"Processing company: {company_name}")
-    docs = await scraper._process_company(company_name, company_url)
+    try:
+        docs = await scraper._process_company(company_name, company_url)
+    finally:
+        await scraper.close()
     
     # Print document details
     print(f"Found {len(docs)} documents:")
@@ -54,11 +54,14 @@ async def test_document_refresh():
     
     # Process companies directly
     all_docs = []
-    for company_name, url in test_companies:
-        print(f"Processing company: {company_name}")
-        docs = await scraper._process_company(company_name, url)
-        all_docs.extend(docs)
-        print(f"  Found {len(docs)} documents")
+    try:
+        for company_name, url in test_companies:
+            print(f"Processing company: {company_name}")
+            docs = await scraper._process_company(company_name, url)
+            all_docs.extend(docs)
+            print(f"  Found {len(docs)} documents")
+    finally:
+        await scraper.close()
     
     # Check if documents have company_page_url field
     docs_with_url = sum(1 for doc in all_docs if 'company_page_url' in doc)
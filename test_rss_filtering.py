@@ -21,7 +21,10 @@ async def test_rss_filtering():
     
     # Fetch RSS feed
     print("\nFetching RSS feed...")
-    items = await rss_reader.fetch_rss_feed()
+    try:
+        items = await rss_reader.fetch_rss_feed()
+    finally:
+        await rss_reader.close()
     print(f"Total RSS items fetched: {len(items)}")
     
     # Test filtering
@@ -22,11 +22,16 @@ async def test_document_check():
     # Make sure bot is initialized
     if not await bot.initialize():
         print("Failed to initialize bot")
+        await bot.cleanup()
         return
     
     print("Checking for document updates...")
     # Directly call the check_documents method
-    new_documents = await bot.check_documents()
+    try:
+        new_documents = await bot.check_documents()
+    finally:
+        # Closes the bot's shared HTTP sessions
+        await bot.cleanup()
     
     print(f"Found {len(new_documents)} new documents")
     